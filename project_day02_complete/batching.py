@@ -0,0 +1,117 @@
+# batching.py
+"""
+Write runs of short, back-to-back ``play`` calls into one partial movie.
+
+Normally every ``play`` gets its own partial movie file: one encoder
+start-up per call, and one more file for the final concat. For beats made of
+many tiny plays (a title written letter by letter), that overhead costs more
+than the frames. With ``PlayBatchingMixin``, consecutive plays of at most
+``batch_max_play`` seconds go into a single open stream. The stream is
+flushed when:
+
+* a longer play starts,
+* a ``wait`` starts,
+* the batch reaches ``batch_max_duration`` seconds,
+* a new section starts, or
+* the scene ends.
+
+The merged file is named after the hashes of all its plays, and the other
+members' entries are blanked in both the scene's and the section's partial
+movie lists, which manim skips when it concatenates. A later run therefore
+never mistakes the batch for the cached movie of its first play, but it
+also cannot reuse it: manim's per-play cache never hits for batched plays,
+so they are encoded again on every render.
+
+MainContent uses it, both inside FinalVideo and rendered on its own:
+
+    manim -ql scenes/main_content.py MainContent
+
+There its 14 title letters and the three 1.3 s fact-box pulses each go into
+one partial movie, 31 partial movies instead of 50. On a re-render the other
+plays come from the cache, and only those 23 batched plays are encoded again.
+"""
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+import hashlib
+import os
+
+
+class BatchingFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, scene, max_play=0.5, max_duration=4.0, **kwargs):
+        # SceneFileWriter.__init__ opens the first section, which flushes: set up the batch state first
+        self.scene = scene
+        self.max_play = max_play
+        self.max_duration = max_duration
+        self._batch = None  # dict(section=partial movie list, start=index, scene_start=index, count=plays, duration=seconds)
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def _batchable(self):
+        animations = getattr(self.scene, "animations", None) or []
+        if any(isinstance(anim, Wait) for anim in animations):
+            return False
+        return self.scene.duration <= self.max_play
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        writing = write_to_movie() and allow_write
+        if not writing or not self._batchable():
+            self.flush()
+            return super().begin_animation(allow_write, file_path)
+        section = self.sections[-1].partial_movie_files
+        if self._batch is not None and self._batch["section"] is section:
+            self._batch["duration"] += self.scene.duration
+            self._batch["count"] += 1
+            return  # keep writing into the open stream
+        self.flush()
+        self.open_partial_movie_stream(file_path=file_path or section[-1])
+        self._batch = dict(section=section, start=len(section) - 1,
+                           scene_start=len(self.partial_movie_files) - 1, count=1, duration=self.scene.duration)
+
+    def end_animation(self, allow_write=False):
+        if self._batch is None:
+            return super().end_animation(allow_write)
+        if self._batch["duration"] >= self.max_duration:
+            self.flush()
+
+    def flush(self):
+        """Close the open batch, if any, and list it as one partial movie."""
+        batch, self._batch = self._batch, None
+        if batch is None:
+            return
+        self.close_partial_movie_stream()
+        # by count, not to the end: when a non-batched play closes the batch, its entry is already listed
+        members = batch["section"][batch["start"]:batch["start"] + batch["count"]]
+        if len(members) > 1:
+            digest = hashlib.sha1("".join(str(path) for path in members).encode()).hexdigest()[:16]
+            merged = os.path.join(os.path.dirname(str(members[0])), f"batch_{digest}{config.movie_file_extension}")
+            os.replace(str(members[0]), merged)
+            # the scene-wide list (combine_to_movie) and the section's list (section videos) both
+            # name every member; keep their lengths, since open_partial_movie_stream indexes the
+            # scene-wide list by play number, and blank the members that were never written
+            collapsed = [merged] + [None] * (len(members) - 1)
+            for files, start in ((self.partial_movie_files, batch["scene_start"]),
+                                 (batch["section"], batch["start"])):
+                files[start:start + len(members)] = collapsed
+
+    def next_section(self, *args, **kwargs):
+        self.flush()
+        return super().next_section(*args, **kwargs)
+
+    def finish(self):
+        self.flush()
+        return super().finish()
+
+
+class PlayBatchingMixin:
+    """Scene mixin: batch short consecutive plays into one partial movie (see the module docstring)."""
+
+    batch_max_play = 0.5
+    batch_max_duration = 4.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        renderer = self.renderer
+        if hasattr(renderer, "file_writer"):  # Cairo renderer; nothing has been written yet
+            renderer.file_writer = BatchingFileWriter(renderer, type(self).__name__, self,
+                                                      max_play=self.batch_max_play,
+                                                      max_duration=self.batch_max_duration)
@@ -0,0 +1,146 @@
+# composition.py
+"""
+Compose a video out of several part scenes.
+
+``ComposedScene`` plays its ``parts`` one after the other in its own renderer.
+Each part gets its own section, followed by a short hold, and the stage is
+cleared before the next part, so ``manim main.py FinalVideo`` renders every
+part as it would render on its own.
+
+``compose()`` renders each part scene to its own movie instead, with the same
+hold rendered onto its end, so both paths give the same cut. Each movie is
+cached under ``media/compose``, keyed by a hash of the part's source, the
+project's helper modules, the hold and the output settings. Only the parts
+whose key changed are rendered again. The part movies are then joined with
+ffmpeg's concat demuxer using stream copy, so nothing is re-encoded:
+
+    python main.py -q h
+"""
+from manim import *
+from manim import config, tempconfig
+import argparse
+import manim
+import glob
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from quality import quality_tier
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+QUALITIES = {"l": "low_quality", "m": "medium_quality", "h": "high_quality", "p": "production_quality", "k": "fourk_quality"}
+
+
+class ComposedScene(Scene):
+    parts = ()
+    hold = 1.0  # seconds each part's last frame stays up
+
+    def construct(self):
+        background = self.camera.background_color
+        for part in self.parts:
+            self.next_section(part.__name__)
+            self.camera.background_color = background
+            part.construct(self)  # the part's beats, played by this scene
+            if self.hold:
+                self.wait(self.hold)
+            self.clear()
+
+
+def held(scene_cls, hold):
+    """``scene_cls`` with ``hold`` seconds of its last frame added at the end, as ComposedScene plays it."""
+    def construct(self):
+        scene_cls.construct(self)
+        if hold:
+            self.wait(hold)
+
+    return type(scene_cls.__name__, (scene_cls,), dict(construct=construct))
+
+
+def part_key(scene_cls, hold=0.0):
+    """Hash of everything a part's movie depends on: its source, the helper modules, the hold and the output settings."""
+    digest = hashlib.sha256()
+    sources = {os.path.abspath(inspect.getsourcefile(scene_cls))}
+    sources.update(os.path.abspath(path) for path in glob.glob(os.path.join(HERE, "*.py")))
+    for path in sorted(sources):
+        digest.update(os.path.relpath(path, HERE).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    settings = (scene_cls.__name__, config.pixel_width, config.pixel_height, config.frame_rate,
+                config.movie_file_extension, quality_tier(), manim.__version__, hold)
+    digest.update(repr(settings).encode())
+    return digest.hexdigest()[:20]
+
+
+def _manifest_path():
+    return os.path.join(config.media_dir, "compose", "parts.json")
+
+
+def _load_manifest():
+    try:
+        with open(_manifest_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(_manifest_path()), exist_ok=True)
+    with open(_manifest_path(), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def render_part(scene_cls, quality, hold=0.0):
+    """Movie path for ``scene_cls`` at ``quality`` (plus ``hold``), rendering it only if its key changed."""
+    with tempconfig({"quality": quality, "write_to_movie": True, "preview": False}):
+        key = part_key(scene_cls, hold)
+        manifest = _load_manifest()
+        entry = manifest.get(scene_cls.__name__)
+        if entry and entry["key"] == key and os.path.exists(entry["path"]):
+            logger.info(f"{scene_cls.__name__}: source unchanged, reusing {entry['path']}")
+            return entry["path"]
+        config.output_file = f"{scene_cls.__name__}_{key}"
+        scene = held(scene_cls, hold)()
+        scene.render()
+        path = str(scene.renderer.file_writer.movie_file_path)
+    manifest = _load_manifest()
+    manifest[scene_cls.__name__] = dict(key=key, path=path)
+    _save_manifest(manifest)
+    return path
+
+
+def concat_lossless(paths, output_path):
+    """Join same-codec movies without re-encoding (ffmpeg concat demuxer, stream copy)."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to join the part movies")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in paths:
+            listing.write(f"file '{os.path.abspath(path)}'\n")
+    try:
+        subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing.name, "-c", "copy", output_path], check=True)
+    finally:
+        os.remove(listing.name)
+    return output_path
+
+
+def compose(composed_cls, quality="high_quality", output=None):
+    """Render (or reuse) every part of ``composed_cls`` and join them into one movie."""
+    movies = [render_part(part, quality, composed_cls.hold) for part in composed_cls.parts]
+    output = output or os.path.join(os.path.dirname(movies[0]), f"{composed_cls.__name__}.mp4")
+    concat_lossless(movies, output)
+    return output
+
+
+def main(composed_cls, argv=None):
+    parser = argparse.ArgumentParser(description=f"Render {composed_cls.__name__} from cached part movies.")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-o", "--output", default=None, help="defaults to the part movies' folder")
+    args = parser.parse_args(argv)
+    os.chdir(HERE)
+    output = compose(composed_cls, QUALITIES[args.quality], args.output)
+    print(f"{composed_cls.__name__} written to {output}")
@@ -1,28 +1,18 @@
 from manim import *
+from batching import PlayBatchingMixin
+from composition import ComposedScene, main as compose_main
 from scenes.intro import Intro
 from scenes.main_content import MainContent
 from scenes.outro import Outro
 
 
-class FinalVideo(Scene):
-    def construct(self):
-        # Intro
-        intro = Intro()
-        intro.construct()
-        self.add(*intro.mobjects)  # add intro elements
+class FinalVideo(PlayBatchingMixin, ComposedScene):
+    # each part plays in this scene's renderer, in its own section, with a 1s hold after it
+    # (python main.py renders the same hold onto each cached part movie)
+    parts = (Intro, MainContent, Outro)
+    hold = 1.0
 
-        self.wait(1)
 
-        # Main Content
-        main_content = MainContent()
-        main_content.construct()
-        self.add(*main_content.mobjects)  # add main content elements
-
-        self.wait(1)
-
-        # Outro
-        outro = Outro()
-        outro.construct()
-        self.add(*outro.mobjects)  # add outro elements
-
-        self.wait(1)
+if __name__ == "__main__":
+    # python main.py -q h: render each part once, reuse unchanged parts, join without re-encoding
+    compose_main(FinalVideo)
@@ -0,0 +1,48 @@
+# orbit_rig.py
+"""
+Reusable ring of orbiting highlight particles.
+
+``OrbitRig`` owns a fixed pool of dots whose colours are picked once, from a
+seeded generator. For each highlight, ``retarget`` gathers the pool at the
+new centre and restores its opacity. ``spread`` and ``fade`` then return
+GroupTweens that send the dots to their orbit slots and fade them out. The
+slots are computed as one angle array. Nothing is created or destroyed
+between highlights, however many cards there are.
+"""
+from manim import *
+import numpy as np
+
+from tweens import GroupTween
+
+
+class OrbitRig(VGroup):
+    def __init__(self, count=12, dot_radius=0.04, palette=(WHITE,), opacity=0.8, seed=None, **kwargs):
+        super().__init__(**kwargs)
+        rng = np.random.default_rng(seed)
+        colors = rng.integers(len(palette), size=count)
+        self.particle_opacity = opacity
+        self.angles = np.linspace(0, TAU, count, endpoint=False)
+        self.add(*[Dot(ORIGIN, radius=dot_radius, color=palette[c], fill_opacity=opacity) for c in colors])
+        self._shape = self.submobjects[0].points.copy()  # every dot shares one outline around the origin
+        self.center_point = ORIGIN.copy()
+
+    def orbit_offsets(self, radius):
+        """Offset of each orbit slot from the centre."""
+        return radius * np.column_stack([np.cos(self.angles), np.sin(self.angles), np.zeros(len(self.angles))])
+
+    def retarget(self, center):
+        """Gather every dot at ``center``, fully visible again."""
+        self.center_point = np.array(center, dtype=float)
+        placed = self._shape + self.center_point
+        for dot in self.submobjects:
+            dot.points = placed.copy()
+        self.set_fill(opacity=self.particle_opacity)
+        return self
+
+    def spread(self, radius=1.2, lag_ratio=0.1, **kwargs):
+        """Animation: dots move out from the centre to their orbit slots."""
+        return GroupTween(self, shift=self.orbit_offsets(radius), lag_ratio=lag_ratio, **kwargs)
+
+    def fade(self, **kwargs):
+        """Animation: every dot fades out where it is."""
+        return GroupTween(self, opacity=0.0, **kwargs)
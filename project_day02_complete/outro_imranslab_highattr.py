@@ -12,6 +12,11 @@ from manim import *
 import math
 import os
 
+from quality import scaled_count, scaled_segments
+import artifact_store
+
+artifact_store.install()
+
 # ---------- Config ----------
 config.background_color = "#FBFBFB"  # near-white background
 # Palette
@@ -58,8 +63,9 @@ def make_nested_polygons(center=ORIGIN, layers=4, base_radius=0.6):
 def make_gradient_ring(radius=1.0, segments=90, width=0.08):
     """
     Simulated gradient ring: many thin arcs with interpolated colors.
-    Returns a VGroup of arcs.
+    Returns a VGroup of arcs. ``segments`` is the final-quality count.
     """
+    segments = scaled_segments(segments, minimum=12)
     arcs = VGroup()
     for i in range(segments):
         theta1 = TAU * (i / segments)
@@ -80,6 +86,7 @@ def make_gradient_ring(radius=1.0, segments=90, width=0.08):
 class ParticleField(VGroup):
     def __init__(self, n_rings=3, per_ring=18, radius_step=0.28, **kwargs):
         super().__init__(**kwargs)
+        per_ring = scaled_count(per_ring, minimum=4)
         dots = []
         for r in range(1, n_rings + 1):
             rads = r * radius_step
@@ -173,7 +180,7 @@ class ImransLabOutroHighAttr(Scene):
             math.cos(3.0 * t) * 0.9 + 0.15 * math.cos(7.0 * t),
             math.sin(4.0 * t) * 0.9 + 0.12 * math.sin(9.0 * t),
             0
-        ]), t_range=[0, TAU])
+        ]), t_range=[0, TAU, TAU / scaled_segments(630, minimum=120)])
         spiro.set_stroke(interp_hex_color(ACCENT, ACCENT2, 0.25), width=2.0)
         spiro.move_to(LEFT * 3.1 + UP * 0.4)
         spiro.set_opacity(0.95)
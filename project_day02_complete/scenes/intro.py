@@ -1,5 +1,18 @@
 from manim import *
+import os
 import random
+import sys
+
+# the shared helpers live in the project root; ``manim scenes/<file>.py`` only puts scenes/ on sys.path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from quality import scaled_count
+from tweens import GroupTween
+import artifact_store
+
+artifact_store.install()
 
 PURE_PINK = "#ff69b4"
 LOGO_GLOW_COLOR = "#ff1493"
@@ -51,7 +64,7 @@ class Intro(Scene):
         # Particle sparkles
         particles = VGroup(*[
             Dot(point=[random.uniform(-6,6), random.uniform(-3,3),0], radius=0.05, color=PURE_PINK)
-            for _ in range(15)
+            for _ in range(scaled_count(15))
         ])
 
         # Light streaks
@@ -105,9 +118,8 @@ class Intro(Scene):
         # 6. Particles Move
         # ----------------------
         self.play(
-            *[p.animate.shift(UP*random.uniform(0.5,1)).set_opacity(0) for p in particles],
-            run_time=1.5,
-            lag_ratio=0.05
+            GroupTween(particles, shift=[UP*random.uniform(0.5,1) for _ in particles], opacity=0, lag_ratio=0.05),
+            run_time=1.5
         )
 
         # ----------------------
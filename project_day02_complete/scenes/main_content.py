@@ -1,7 +1,23 @@
 from manim import *
+import os
 import random
+import sys
 import numpy as np
 
+# the shared helpers live in the project root; ``manim scenes/<file>.py`` only puts scenes/ on sys.path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from batching import PlayBatchingMixin
+from dotcloud import DotCloudLayer
+from orbit_rig import OrbitRig
+from quality import scaled_count
+from tweens import ParticleBurst
+import artifact_store
+
+artifact_store.install()
+
 # Color palette
 PURE_PINK = "#ff69b4"
 LOGO_GLOW_COLOR = "#ff1493"
@@ -14,7 +30,7 @@ STREAK_COLOR = "#ffb6c1"
 ACCENT_BLUE = "#4169e1"
 ACCENT_PURPLE = "#9370db"
 
-class MainContent(Scene):
+class MainContent(PlayBatchingMixin, Scene):
     def construct(self):
         # Total animation time: ~3 minutes
         self.camera.background_color = WHITE
@@ -31,12 +47,10 @@ class MainContent(Scene):
         )
         self.add(bg_rect)
         
-        # Create a subtle grid pattern
-        grid = VGroup()
-        for x in np.arange(-7, 7, 1):
-            for y in np.arange(-4, 4, 1):
-                dot = Dot(point=[x, y, 0], radius=0.02, color=ACCENT_BLUE, fill_opacity=0.1)
-                grid.add(dot)
+        # Create a subtle grid pattern (one image for all 112 dots)
+        xs, ys = np.meshgrid(np.arange(-7, 7, 1), np.arange(-4, 4, 1), indexing="ij")
+        grid_centers = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)])
+        grid = DotCloudLayer(grid_centers, 0.02, colors=ACCENT_BLUE, opacities=0.1)
         self.add(grid)
         
         # ----------------------
@@ -49,7 +63,7 @@ class MainContent(Scene):
         title_group = VGroup(title, subtitle)
         title_group.move_to(UP * 2.5)
         
-        # Animated title reveal
+        # Animated title reveal (the 0.1s letter plays are written as one partial movie)
         for letter in title:
             self.play(Write(letter), run_time=0.1)
         self.play(Write(subtitle), run_time=1.5)
@@ -129,6 +143,9 @@ class MainContent(Scene):
         # ----------------------
         # 4. Interactive Member Highlights
         # ----------------------
+        # one pool of orbiting particles, moved from card to card
+        orbit_rig = OrbitRig(count=12, dot_radius=0.04, palette=(PURE_PINK, ACCENT_BLUE, ACCENT_PURPLE),
+                             opacity=0.8, seed=random.randrange(2**32))
         for i, card in enumerate(member_cards):
             # Highlight current card
             self.play(
@@ -137,27 +154,9 @@ class MainContent(Scene):
                 run_time=1
             )
             
-            # Create orbiting particles around the highlighted card
-            particles = VGroup()
-            for angle in np.linspace(0, 2*PI, 12, endpoint=False):
-                particle = Dot(
-                    point=card.get_center(),
-                    radius=0.04,
-                    color=random.choice([PURE_PINK, ACCENT_BLUE, ACCENT_PURPLE]),
-                    fill_opacity=0.8
-                )
-                particles.add(particle)
-                
-            # Animate particles in orbit
-            self.play(
-                AnimationGroup(*[
-                    particle.animate.move_to(
-                        card.get_center() + 1.2 * np.array([np.cos(angle), np.sin(angle), 0])
-                    )
-                    for particle, angle in zip(particles, np.linspace(0, 2*PI, 12, endpoint=False))
-                ], lag_ratio=0.1),
-                run_time=1.5
-            )
+            # Orbiting particles around the highlighted card
+            orbit_rig.retarget(card.get_center())
+            self.play(orbit_rig.spread(radius=1.2, lag_ratio=0.1), run_time=1.5)
             
             # Pulse effect for the fact text
             fact_box = SurroundingRectangle(card[4], color=ACCENT_PURPLE, buff=0.1, stroke_width=2)
@@ -169,11 +168,12 @@ class MainContent(Scene):
             self.play(
                 card.animate.scale(1/1.15).set_stroke(color=ACCENT_BLUE, width=3),
                 *[other.animate.set_opacity(1) for j, other in enumerate(member_cards) if j != i],
-                FadeOut(particles),
+                orbit_rig.fade(),
                 run_time=1
             )
             
             self.wait(0.3)
+        self.remove(orbit_rig)
         
                 # 5. Team Collaboration Visualization (fixed)
         # ----------------------
@@ -252,26 +252,18 @@ class MainContent(Scene):
             run_time=1.5
         )
         
-        # Final particle explosion effect
-        final_particles = VGroup()
-        for _ in range(60):
-            particle = Dot(
-                point=finale_text.get_center(),
-                radius=random.uniform(0.03, 0.1),
-                color=random.choice([PURE_PINK, ACCENT_BLUE, ACCENT_PURPLE]),
-                fill_opacity=0.9
-            )
-            angle = random.uniform(0, 2*PI)
-            distance = random.uniform(3, 6)
-            target_pos = particle.get_center() + distance * np.array([np.cos(angle), np.sin(angle), 0])
-            final_particles.add(particle)
-            
-            self.add(particle)
-            self.play(
-                particle.animate.move_to(target_pos).set_opacity(0),
-                run_time=2,
-                rate_func=smooth
-            )
+        # Final particle explosion effect: every particle in one 2s play
+        burst = ParticleBurst(
+            finale_text.get_center(),
+            count=scaled_count(60),
+            seed=random.randrange(2**32),
+            radius_range=(0.03, 0.1),
+            palette=(PURE_PINK, ACCENT_BLUE, ACCENT_PURPLE),
+            speed_range=(1.5, 3.0),  # 3-6 units over the 2s burst
+            run_time=2
+        )
+        final_particles = burst.mobject
+        self.play(burst)
         
         # Hold the final frame
         self.wait(3)
@@ -1,4 +1,15 @@
 from manim import *
+import os
+import sys
+
+# the shared helpers live in the project root; ``manim scenes/<file>.py`` only puts scenes/ on sys.path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import artifact_store
+
+artifact_store.install()
 
 class Outro(Scene):
     def construct(self):
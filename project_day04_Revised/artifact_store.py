@@ -0,0 +1,200 @@
+# artifact_store.py
+"""
+One content-addressed store for rendered text and LaTeX SVGs, shared by every project folder.
+
+Manim caches Pango and LaTeX output per project, under ``media/texts`` and
+``media/Tex``, so the same strings are rendered again in every folder. After
+``install()``, ``Text``/``MarkupText`` and ``Tex``/``MathTex`` look in this store
+before calling Pango or LaTeX, and add what they render to it. The store is a
+single SQLite file of blobs keyed by content hash:
+
+* text keys are manim's own text hash, which covers the string, font, size,
+  colours and manim version,
+* LaTeX keys hash the expression, the environment and the template preamble.
+
+The least recently used entries are evicted once the store grows past
+``max_bytes``. The location is ``MANIM_ARTIFACT_STORE`` if set, otherwise
+``~/.cache/imranslab-manim/artifacts.sqlite3``, so a cold render of a fresh
+project folder starts from the same store as a warm one. Several render
+processes can use it at once. Strings already in a project's own cache are
+added to the store too, so a warm folder shares them with the cold ones.
+
+The store is only ever a shortcut. If it cannot be opened, read or written
+(locked past the timeout, corrupt, on a read-only mount), a warning is logged
+once, the store is switched off for the rest of the process, and text and
+LaTeX render exactly as they would without it.
+"""
+from manim import config, logger
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_STORE = os.path.join(os.path.expanduser("~"), ".cache", "imranslab-manim", "artifacts.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_STORE = None
+
+
+class ArtifactStore:
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or os.environ.get("MANIM_ARTIFACT_STORE") or DEFAULT_STORE
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._pid = None
+        self.disabled = False
+
+    def _fail(self, err):
+        if not self.disabled:
+            logger.warning(f"artifact store {self.path} unavailable, rendering without it: {err}")
+        self.disabled = True
+
+    @property
+    def _db(self):
+        # one connection per process: render workers forked after install() must not share it
+        if self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS artifacts ("
+                         "key TEXT PRIMARY KEY, kind TEXT, data BLOB, size INTEGER, last_used REAL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS artifacts_lru ON artifacts(last_used)")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key):
+        """Stored bytes for ``key`` (marking it as recently used), or None."""
+        if self.disabled:
+            return None
+        try:
+            row = self._db.execute("SELECT data FROM artifacts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE artifacts SET last_used = ? WHERE key = ?", (time.time(), key))
+        except (OSError, sqlite3.Error) as err:
+            self._fail(err)
+            return None
+        return row[0]
+
+    def contains(self, key):
+        if self.disabled:
+            return False
+        try:
+            return self._db.execute("SELECT 1 FROM artifacts WHERE key = ?", (key,)).fetchone() is not None
+        except (OSError, sqlite3.Error) as err:
+            self._fail(err)
+            return False
+
+    def put(self, key, kind, data):
+        if self.disabled:
+            return
+        try:
+            self._db.execute("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                             (key, kind, sqlite3.Binary(data), len(data), time.time()))
+            self.evict()
+        except (OSError, sqlite3.Error) as err:
+            self._fail(err)
+
+    def total_bytes(self):
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used entries until the store is within ``max_bytes``."""
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return 0
+        dropped = 0
+        for key, size in self._db.execute("SELECT key, size FROM artifacts ORDER BY last_used").fetchall():
+            if excess <= 0:
+                break
+            self._db.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+            excess -= size
+            dropped += 1
+        return dropped
+
+    def restore(self, key, path):
+        """Write the stored artifact for ``key`` to ``path``; False if it is not stored."""
+        data = self.get(key)
+        if data is None:
+            return False
+        path = Path(path)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as err:
+            logger.warning(f"artifact store: could not restore {path}: {err}")
+            return False
+        return True
+
+    def keep(self, key, kind, path):
+        """Store the file at ``path`` under ``key``."""
+        try:
+            data = Path(path).read_bytes()
+        except OSError as err:
+            logger.warning(f"artifact store: could not keep {path}: {err}")
+            return
+        self.put(key, kind, data)
+
+
+def artifact_store():
+    """The store installed by ``install()`` (None before that)."""
+    return _STORE
+
+
+def _wrap_text(cls):
+    original = cls._text2svg
+    if getattr(original, "uses_artifact_store", False):
+        return
+
+    def _text2svg(self, color, *args, **kwargs):
+        hash_name = self._text2hash(color)
+        key = "text:" + hash_name
+        path = Path(config.get_dir("text_dir")) / (hash_name + ".svg")
+        restored = not path.exists() and _STORE.restore(key, path)
+        svg_file = original(self, color, *args, **kwargs)
+        if not restored and not _STORE.contains(key):
+            # rendered just now, or found in this project's own cache: share it
+            _STORE.keep(key, "text", svg_file)
+        return svg_file
+
+    _text2svg.uses_artifact_store = True
+    cls._text2svg = _text2svg
+
+
+def _wrap_tex(module):
+    original = module.tex_to_svg_file
+    if getattr(original, "uses_artifact_store", False):
+        return
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        template = tex_template or config.tex_template
+        digest = hashlib.sha256(repr((expression, environment, template.body)).encode()).hexdigest()[:32]
+        key = "tex:" + digest
+        path = Path(config.get_dir("tex_dir")) / f"store_{digest}.svg"
+        if path.exists() or _STORE.restore(key, path):
+            if not _STORE.contains(key):
+                _STORE.keep(key, "tex", path)  # evicted since it was restored here
+            return path
+        # a hit in manim's own tex cache is shared as well
+        svg_file = original(expression, environment=environment, tex_template=tex_template)
+        if not _STORE.contains(key):
+            _STORE.keep(key, "tex", svg_file)
+        return svg_file
+
+    tex_to_svg_file.uses_artifact_store = True
+    module.tex_to_svg_file = tex_to_svg_file
+
+
+def install(path=None, max_bytes=DEFAULT_MAX_BYTES):
+    """Route Text/MarkupText and Tex/MathTex rendering through the shared store (idempotent)."""
+    global _STORE
+    if _STORE is None:
+        _STORE = ArtifactStore(path, max_bytes)
+    from manim.mobject.text import tex_mobject, text_mobject
+    _wrap_text(text_mobject.Text)
+    _wrap_text(text_mobject.MarkupText)
+    _wrap_tex(tex_mobject)
+    return _STORE
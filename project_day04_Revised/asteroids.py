@@ -0,0 +1,69 @@
+# asteroids.py
+"""
+Array-backed asteroid belt with per-rock orbits, drawn through one DotCloudLayer image.
+"""
+from manim import *
+import numpy as np
+
+from dotcloud import DotCloudLayer
+
+
+class AsteroidBelt(DotCloudLayer):
+    """
+    Belt of small elliptical rocks, each on its own circular orbit.
+
+    Every rock has an orbital radius, a starting phase, a vertical offset and
+    a spin. Angular velocity follows Kepler's third law, ``omega ~ r ** -1.5``,
+    scaled so rocks at the inner edge move at ``angular_speed`` (rad/s), so the
+    inner belt overtakes the outer belt. Positions and spins are closed-form
+    functions of the belt's clock, which its updater advances with ``dt``:
+    nothing accumulates per frame and ``at(t)`` jumps straight to any time.
+    """
+
+    def __init__(self, n=400, radius_range=(2.6, 4.2), spread_y=1.2, size_range=(0.04, 0.14),
+                 color="#A88B6D", center=ORIGIN, angular_speed=0.0012, spin_range=(-0.6, 0.6),
+                 seed=None, **kwargs):
+        rng = np.random.default_rng(seed)
+        self.orbit_center = np.array(center, dtype=float)
+        self.orbit_radius = rng.uniform(*radius_range, n)
+        self.phase = rng.uniform(0, TAU, n)
+        self.offset_y = rng.uniform(-spread_y, spread_y, n)
+        self.angular_velocity = angular_speed * (radius_range[0] / self.orbit_radius) ** 1.5
+        size = rng.uniform(*size_range, n)
+        # semi-axes, as Ellipse(width=size * [0.6, 1.4], height=size * [0.4, 1.0])
+        axes = np.sort(np.column_stack([size * rng.uniform(0.6, 1.4, n), size * rng.uniform(0.4, 1.0, n)]) / 2, axis=1)
+        self.aspect = axes[:, 0] / axes[:, 1]
+        self.spin_phase = rng.uniform(0, TAU, n)
+        self.spin = rng.uniform(*spin_range, n)
+        self.time = 0.0
+
+        reach = radius_range[1] + spread_y + axes[:, 1].max()
+        cx, cy = self.orbit_center[:2]
+        super().__init__(self._positions(0.0), axes[:, 1], colors=color,
+                         bounds=(cx - reach, cx + reach, cy - reach, cy + reach), **kwargs)
+        self.add_updater(lambda m, dt: m.at(m.time + dt))
+
+    def _positions(self, time):
+        angle = self.phase + self.angular_velocity * time
+        x = self.orbit_radius * np.cos(angle)
+        y = self.orbit_radius * np.sin(angle) + self.offset_y
+        return self.orbit_center + np.column_stack([x, y, np.zeros_like(x)])
+
+    def at(self, time):
+        """Place every rock where it is ``time`` seconds into the belt's clock."""
+        if time == self.time:
+            return self
+        self.time = time
+        self.centers = self._positions(time)
+        return self.refresh(moved=True)
+
+    def _stamp_coverage(self, ids, dx, dy, rpx):
+        # rotate the pixel offsets into each rock's frame (y up) and measure against its ellipse
+        theta = (self.spin_phase[ids] + self.spin[ids] * self.time)[:, None]
+        u = dx * np.cos(theta) - dy * np.sin(theta)
+        v = -dx * np.sin(theta) - dy * np.cos(theta)
+        minor = np.maximum(rpx * self.aspect[ids, None], 0.5)
+        rho = np.hypot(u, v)
+        norm = np.hypot(u / rpx, v / minor)
+        edge = np.where(norm > 1e-9, rho / np.maximum(norm, 1e-9), rpx)
+        return np.clip(edge + 0.5 - rho, 0.0, 1.0)
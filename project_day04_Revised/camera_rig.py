@@ -0,0 +1,180 @@
+# camera_rig.py
+"""
+Procedural camera rig: sway, roll and shake as closed-form functions of
+absolute scene time.
+
+Nothing here accumulates per-frame state. ``CameraRig.offset(t)`` and
+``CameraRig.angle(t)`` can be evaluated for any t in any order, so the pose
+of frame N does not depend on frames 0..N-1 having been rendered first.
+The rig is applied by ``RigCamera`` at capture time on top of whatever the
+scene animates the frame to, and removed again right after, so
+``camera.frame`` itself never carries sway or shake.
+"""
+from manim import *
+import math
+import numpy as np
+
+from culling import FrustumCullingMixin
+from sprites import SpriteCameraMixin
+
+
+def _hash01(i: int, seed: int, channel: int) -> float:
+    """Deterministic pseudo-random value in [0, 1] for an integer lattice point."""
+    x = (i * 374761393 + seed * 668265263 + channel * 2246822519) & 0xFFFFFFFF
+    x = ((x ^ (x >> 13)) * 1274126177) & 0xFFFFFFFF
+    x ^= x >> 16
+    return x / 0xFFFFFFFF
+
+
+def value_noise(t: float, rate: float, seed: int, channel: int = 0) -> float:
+    """Smoothly interpolated noise in [-1, 1]; a new random target ``rate`` times per second."""
+    u = t * rate
+    i = math.floor(u)
+    f = u - i
+    f = f * f * (3 - 2 * f)
+    a = _hash01(i, seed, channel)
+    b = _hash01(i + 1, seed, channel)
+    return 2.0 * (a + (b - a) * f) - 1.0
+
+
+class CameraShake:
+    """One shake event: noise of ``strength`` units fading linearly at ``decay`` per second."""
+
+    def __init__(self, start, strength, decay=0.15, rate=60.0, roll=0.0, roll_freq=50.0, end=None, channel=0):
+        self.start = start
+        self.end = end
+        self.strength = strength
+        self.decay = decay
+        self.rate = rate
+        self.roll = roll
+        self.roll_freq = roll_freq
+        self.channel = channel
+
+    @property
+    def stop(self):
+        """Time after which the envelope stays 0 (inf for a shake that never fades or ends)."""
+        faded = self.start + 1.0 / self.decay if self.decay > 0 else math.inf
+        return faded if self.end is None else min(faded, self.end)
+
+    def envelope(self, t):
+        if t < self.start or (self.end is not None and t >= self.end):
+            return 0.0
+        return max(0.0, 1.0 - (t - self.start) * self.decay)
+
+
+class CameraRig:
+    """
+    Seeded, time-addressable camera motion.
+
+    Sway is a sum of sines per axis, roll a single sine, both with phases
+    drawn from ``seed`` and offset so the pose is exactly neutral at t=0.
+    Shakes are value noise keyed by (seed, event, axis), scaled by their
+    envelope.
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._phases = rng.uniform(0, TAU, 3)
+        self.sway_amplitude = np.zeros(2)
+        self.sway_frequency = np.zeros(2)
+        self.roll_amplitude = 0.0
+        self.roll_frequency = 0.0
+        self.shakes = []
+
+    def set_sway(self, x=(0.0, 0.0), y=(0.0, 0.0), roll=(0.0, 0.0)):
+        """Each argument is (amplitude, angular frequency in rad/s)."""
+        self.sway_amplitude = np.array([x[0], y[0]], dtype=float)
+        self.sway_frequency = np.array([x[1], y[1]], dtype=float)
+        self.roll_amplitude, self.roll_frequency = roll
+        return self
+
+    def add_shake(self, start, strength, **kwargs):
+        shake = CameraShake(start, strength, channel=len(self.shakes), **kwargs)
+        self.shakes.append(shake)
+        return shake
+
+    def end_shake(self, shake, t):
+        shake.end = t
+        return shake
+
+    def is_active(self, t=None):
+        """Whether the pose can move at or after ``t``; shakes that have already died out do not count."""
+        if np.any(self.sway_amplitude) or self.roll_amplitude:
+            return True
+        if t is None:
+            return bool(self.shakes)
+        return any(shake.stop > t for shake in self.shakes)
+
+    def offset(self, t):
+        p = self._phases[:2]
+        xy = self.sway_amplitude * (np.sin(self.sway_frequency * t + p) - np.sin(p))
+        for shake in self.shakes:
+            env = shake.envelope(t)
+            if env > 0:
+                xy = xy + shake.strength * env * np.array([
+                    value_noise(t, shake.rate, self.seed, 2 * shake.channel),
+                    value_noise(t, shake.rate, self.seed, 2 * shake.channel + 1),
+                ])
+        return np.array([xy[0], xy[1], 0.0])
+
+    def angle(self, t):
+        p = self._phases[2]
+        a = self.roll_amplitude * (math.sin(self.roll_frequency * t + p) - math.sin(p))
+        for shake in self.shakes:
+            if shake.roll:
+                a += shake.roll * math.sin(shake.roll_freq * t) * shake.envelope(t)
+        return a
+
+    def pose(self, t):
+        return self.offset(t), self.angle(t)
+
+
+class RigCamera(SpriteCameraMixin, FrustumCullingMixin, MovingCamera):
+    """MovingCamera that adds its rig's pose to the frame only while capturing (also culls and draws baked sprites)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rig = None
+        self.time_source = None
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if self.rig is None or self.time_source is None or not self.rig.is_active(self.time_source()):
+            return super().capture_mobjects(mobjects, **kwargs)
+        offset, angle = self.rig.pose(self.time_source())
+        frame = self.frame
+        frame.shift(offset)
+        if angle:
+            frame.rotate(angle)
+        # overlays pinned to the frame must see the rigged pose too
+        for mob in mobjects:
+            if getattr(mob, "follows_camera_frame", False):
+                mob.pin_to(frame)
+        try:
+            super().capture_mobjects(mobjects, **kwargs)
+        finally:
+            if angle:
+                frame.rotate(-angle)
+            frame.shift(-offset)
+
+
+class RiggedCameraScene(MovingCameraScene):
+    """MovingCameraScene with a ``self.rig`` driven by absolute scene time."""
+
+    camera_rig_seed = 0
+
+    def __init__(self, camera_class=RigCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
+
+    def setup(self):
+        super().setup()
+        self.rig = CameraRig(seed=self.camera_rig_seed)
+        self.camera.rig = self.rig
+        self.camera.time_source = lambda: self.renderer.time
+
+    def get_moving_mobjects(self, *animations):
+        # while the rig moves the view (a shake may also start during this play),
+        # nothing can be cached as a static image
+        if self.rig.is_active(self.renderer.time):
+            return self.get_mobject_family_members()
+        return super().get_moving_mobjects(*animations)
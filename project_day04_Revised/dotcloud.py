@@ -0,0 +1,156 @@
+# dotcloud.py
+"""
+Many small round dots drawn as a single anti-aliased image.
+
+``DotCloudLayer`` is the shared primitive behind the starfields, the galaxy,
+the comet pool, the exhaust particles, the asteroid belt and the background
+dot grid: per-dot state lives in numpy arrays and a refresh splats every dot
+into one pixel array.
+"""
+from manim import *
+from manim import config
+import math
+import numpy as np
+
+
+# --------------------
+# Small utilities
+# --------------------
+def as_rgb_array(colors, n: int) -> np.ndarray:
+    """Return an (n, 3) float array of rgb values in [0, 1]."""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        return np.broadcast_to(colors[:, :3].astype(float), (n, 3)).copy()
+    if isinstance(colors, (str, ManimColor)):
+        return np.tile(np.asarray(color_to_rgb(colors), dtype=float), (n, 1))
+    return np.array([color_to_rgb(c) for c in colors], dtype=float).reshape(n, 3)
+
+
+# --------------------
+# Generic dot layer
+# --------------------
+class DotCloudLayer(ImageMobject):
+    """
+    Many small round dots drawn as one anti-aliased image.
+
+    Centers, radii, colors and opacities are plain numpy arrays. After
+    changing them call ``refresh()`` (``moved=True`` when centers or radii
+    changed) to splat every dot into the pixel array in one vectorized pass.
+    While only opacities change the per-pixel coverage is reused, so the
+    per-frame cost is a handful of ``np.bincount`` calls.
+
+    Centers are in scene units at the time the layer is built; moving,
+    scaling or rotating the layer afterwards transforms the whole image.
+    """
+
+    # the camera may hand only the in-view slice of the canvas to the compositor
+    crop_to_view = True
+
+    def __init__(self, centers, radii, colors=WHITE, opacities=1.0, bounds=None, pixels_per_unit=None, **kwargs):
+        centers = np.array(centers, dtype=float).reshape(-1, 3)
+        n = len(centers)
+        radii = np.broadcast_to(np.asarray(radii, dtype=float), (n,)).copy()
+        if pixels_per_unit is None:
+            pixels_per_unit = config.pixel_height / config.frame_height
+        ppu = float(pixels_per_unit)
+        if bounds is None:
+            pad = (radii.max() if n else 0.0) + 2.0 / ppu
+            if n:
+                bounds = (centers[:, 0].min() - pad, centers[:, 0].max() + pad,
+                          centers[:, 1].min() - pad, centers[:, 1].max() + pad)
+            else:
+                bounds = (-pad, pad, -pad, pad)
+        super().__init__(np.zeros((1, 1, 4), dtype=np.uint8), **kwargs)
+        self.centers = centers
+        self.radii = radii
+        self.rgb = as_rgb_array(colors, n)
+        self.opacities = np.broadcast_to(np.asarray(opacities, dtype=float), (n,)).copy()
+        self.layer_opacity = 1.0
+        self.pixels_per_unit = ppu
+        self.set_bounds(bounds)
+        self.refresh(moved=True)
+
+    def set_bounds(self, bounds):
+        """Reallocate a blank canvas covering (xmin, xmax, ymin, ymax) and fit the image to it."""
+        ppu = self.pixels_per_unit
+        x0, x1, y0, y1 = bounds
+        width_px = max(1, int(math.ceil((x1 - x0) * ppu)))
+        height_px = max(1, int(math.ceil((y1 - y0) * ppu)))
+        self.pixel_array = np.zeros((height_px, width_px, 4), dtype=np.uint8)
+        self.stretch_to_fit_width(width_px / ppu)
+        self.stretch_to_fit_height(height_px / ppu)
+        self.move_to(np.array([x0 + width_px / ppu / 2, y0 + height_px / ppu / 2, 0]))
+        # canvas origin: scene position of the top-left pixel corner
+        self._canvas_origin = (x0, y0 + height_px / ppu)
+        self._footprint = None
+        return self
+
+    def _build_footprint(self):
+        """Coverage of every pixel touched by every dot, plus the unique pixel set."""
+        ppu = self.pixels_per_unit
+        left, top = self._canvas_origin
+        height_px, width_px = self.pixel_array.shape[:2]
+        if len(self.centers) == 0:
+            empty = np.zeros(0, dtype=int)
+            return empty, np.zeros(0), empty, empty
+
+        px = (self.centers[:, 0] - left) * ppu
+        py = (top - self.centers[:, 1]) * ppu
+        rpx = np.maximum(self.radii * ppu, 0.5)
+        reach_of = np.ceil(rpx).astype(int) + 1
+
+        # dots are bucketed by pixel reach so one big dot does not widen every stamp
+        ids_parts, cover_parts, flat_parts = [], [], []
+        for reach in np.unique(reach_of):
+            ids = np.nonzero(reach_of == reach)[0]
+            offsets = np.arange(-reach, reach + 1)
+            dx, dy = np.meshgrid(offsets, offsets)
+            cols = np.floor(px[ids]).astype(int)[:, None] + dx.ravel()[None, :]
+            rows = np.floor(py[ids]).astype(int)[:, None] + dy.ravel()[None, :]
+            cover = self._stamp_coverage(ids, cols + 0.5 - px[ids, None], rows + 0.5 - py[ids, None], rpx[ids, None])
+            keep = (cover > 0) & (cols >= 0) & (cols < width_px) & (rows >= 0) & (rows < height_px)
+            ids_parts.append(np.broadcast_to(ids[:, None], cover.shape)[keep])
+            cover_parts.append(cover[keep])
+            flat_parts.append((rows * width_px + cols)[keep])
+
+        dot_ids = np.concatenate(ids_parts)
+        pixels, inverse = np.unique(np.concatenate(flat_parts), return_inverse=True)
+        return dot_ids, np.concatenate(cover_parts), pixels, inverse
+
+    def _stamp_coverage(self, ids, dx, dy, rpx):
+        """Coverage of pixels at offsets (dx, dy) (pixels, y down) from the dots ``ids`` of radius ``rpx``."""
+        return np.clip(rpx + 0.5 - np.hypot(dx, dy), 0.0, 1.0)
+
+    def _canvas(self):
+        if not self.pixel_array.flags.c_contiguous:
+            self.pixel_array = np.ascontiguousarray(self.pixel_array)
+        return self.pixel_array.reshape(-1, 4)
+
+    def refresh(self, moved=False):
+        """Re-splat the dots; pass ``moved=True`` after changing centers or radii."""
+        canvas = self._canvas()
+        if moved or self._footprint is None:
+            if self._footprint is not None:
+                canvas[self._footprint[2]] = 0
+            self._footprint = self._build_footprint()
+        dot_ids, cover, pixels, inverse = self._footprint
+        if len(pixels) == 0:
+            return self
+
+        weight = cover * self.opacities[dot_ids] * self.layer_opacity
+        m = len(pixels)
+        alpha = np.bincount(inverse, weights=weight, minlength=m)
+        rgba = np.empty((m, 4))
+        for c in range(3):
+            rgba[:, c] = np.bincount(inverse, weights=weight * self.rgb[dot_ids, c], minlength=m)
+        rgba[:, :3] /= np.maximum(alpha, 1e-9)[:, None]
+        rgba[:, 3] = alpha
+        canvas[pixels] = (np.clip(rgba, 0.0, 1.0) * 255).astype(np.uint8)
+        return self
+
+    def set_opacity(self, alpha):
+        # ImageMobject.set_opacity would flatten the alpha channel; scale the dots instead
+        self.layer_opacity = float(alpha)
+        return self.refresh()
+
+    def fade(self, darkness=0.5, family=True):
+        return self.set_opacity(1.0 - darkness)
@@ -0,0 +1,123 @@
+# hud.py
+"""
+LaTeX-free numeric readouts drawn from a cached glyph atlas.
+
+``GlyphCounter`` is a drop-in for the HUD uses of ``DecimalNumber``. The
+glyphs (digits, sign, decimal point and any unit characters) are laid out
+with Pango once per font/size and kept in ``_ATLAS_CACHE``. After that, a
+value change only copies the cached outline points into fixed character
+slots; no LaTeX, SVG parsing or new mobjects per frame.
+"""
+from manim import *
+import numpy as np
+
+MINUS = "−"
+_ATLAS_CACHE = {}
+# the scale reference point sits this far above the layout origin
+_REF = 0.01
+
+
+class GlyphAtlas:
+    """Outline points and advance widths per character, relative to a shared baseline."""
+
+    def __init__(self, charset, font="", weight=NORMAL, font_size=48):
+        chars = [c for c in dict.fromkeys(charset) if not c.isspace()]
+        text = Text("".join(chars), font=font, weight=weight, font_size=font_size, disable_ligatures=True)
+        glyphs = dict(zip(chars, text.submobjects))
+        reference = glyphs.get("0", text.submobjects[0])
+        baseline = reference.get_bottom()[1]
+        digit_width = max((glyphs[c].width for c in "0123456789" if c in glyphs), default=reference.width)
+
+        self.points = {}
+        self.advance = {}
+        for ch, glyph in glyphs.items():
+            self.points[ch] = glyph.points - np.array([glyph.get_left()[0], baseline, 0])
+            # tabular digits, so a counting readout does not jitter sideways
+            self.advance[ch] = digit_width if ch.isdigit() else glyph.width
+        self.gap = 0.08 * reference.height
+        self.space = 0.5 * digit_width
+
+    def __deepcopy__(self, memo):
+        # atlases are read-only and shared by every counter (and its copies)
+        return self
+
+
+def glyph_atlas(charset, font="", weight=NORMAL, font_size=48):
+    key = ("".join(sorted(set(charset))), font, weight, font_size)
+    if key not in _ATLAS_CACHE:
+        _ATLAS_CACHE[key] = GlyphAtlas(key[0], font, weight, font_size)
+    return _ATLAS_CACHE[key]
+
+
+class GlyphCounter(VGroup):
+    """
+    Numeric readout with DecimalNumber-like formatting.
+
+    ``align`` is the edge that stays put when the text gets wider or
+    narrower (``LEFT`` like DecimalNumber, or ``RIGHT`` for readouts
+    pinned to a right-hand corner). Moving and scaling the counter works as
+    usual; rotations are not supported.
+    """
+
+    def __init__(self, number=0, num_decimal_places=2, unit="", include_sign=False, align=LEFT,
+                 font="", weight=NORMAL, font_size=48, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.unit = unit
+        self.include_sign = include_sign
+        self.align = align
+        self.atlas = glyph_atlas("0123456789+." + MINUS + unit, font, weight, font_size)
+        self._origin = VectorizedPoint(ORIGIN)
+        self._ref = VectorizedPoint(UP * _REF)
+        self.add(self._origin, self._ref)
+        self.slots = []
+        self.number = number
+        self._text = None
+        self._fill_color = color
+        self.set_value(number)
+
+    def format(self, number):
+        sign = "+" if self.include_sign else ""
+        return f"{number:{sign}.{self.num_decimal_places}f}".replace("-", MINUS) + self.unit
+
+    def _new_slot(self):
+        slot = VMobject(fill_color=self._fill_color, fill_opacity=1, stroke_width=0)
+        if self.slots:
+            slot.match_style(self.slots[0])
+        self.slots.append(slot)
+        self.add(slot)
+        return slot
+
+    def set_value(self, number):
+        self.number = number
+        text = self.format(number)
+        if text == self._text:
+            return self
+        self._text = text
+
+        atlas = self.atlas
+        xs, x = [], 0.0
+        for ch in text:
+            if ch.isspace():
+                x += atlas.space
+                continue
+            xs.append((ch, x))
+            x += atlas.advance[ch] + atlas.gap
+        width = max(0.0, x - atlas.gap)
+        offset = -width if np.array_equal(self.align, RIGHT) else 0.0
+
+        origin = self._origin.get_center()
+        scale = np.linalg.norm(self._ref.get_center() - origin) / _REF
+        while len(self.slots) < len(xs):
+            self._new_slot()
+        for slot, (ch, x) in zip(self.slots, xs):
+            slot.points = origin + scale * (atlas.points[ch] + np.array([x + offset, 0.0, 0.0]))
+        for slot in self.slots[len(xs):]:
+            slot.points = np.zeros((0, 3))
+        return self
+
+    def get_value(self):
+        return self.number
+
+    def increment_value(self, delta=1):
+        return self.set_value(self.number + delta)
@@ -2,6 +2,22 @@ from manim import *
 import numpy as np
 import random
 
+from asteroids import AsteroidBelt
+from camera_rig import RiggedCameraScene
+from culling import ParallaxLayer
+from hud import GlyphCounter
+from overlays import FilmGrainOverlay
+from particles import ExhaustParticles
+from sprites import BakedGroup
+from trails import RingTrail
+from tweens import GroupTween
+from profiling import UpdaterProfilingMixin
+from quality import effects_enabled, scaled_count, scaled_resolution, scaled_segments
+from updater_scope import scoped_beat
+import artifact_store
+
+artifact_store.install()  # Text/glyph SVGs come from the shared store when already rendered
+
 def create_rocket(scale=0.9):
     # compact rocket from original file, returned as VGroup with .flames property
     body = RoundedRectangle(corner_radius=0.32, width=1.0, height=2.4,
@@ -58,14 +74,16 @@ def create_rocket(scale=0.9):
 
     flames = VGroup(flame_outer, flame_mid, flame_core).shift(DOWN * 1.15)
 
-    rocket = VGroup(body, nose, booster_left, booster_right, window_top, window_bottom, fin_left, fin_right, flames)
+    # the hull is rigid, so it is drawn from a cached sprite; the flames keep changing and stay vectors
+    hull = BakedGroup(body, nose, booster_left, booster_right, window_top, window_bottom, fin_left, fin_right)
+    rocket = VGroup(hull, flames)
     rocket.scale(scale)
     rocket.flames = flames  # attach for easy access
     return rocket
 
-def make_parallax_stars(n=60, spread=8, color="#FFF9C4", scale_range=(0.03, 0.12)):
-    # returns VGroup of dots for a star layer
-    stars = VGroup()
+def make_parallax_stars(n=60, spread=8, color="#FFF9C4", scale_range=(0.03, 0.12), velocity=ORIGIN):
+    # returns a ParallaxLayer of dots: scrolls at ``velocity`` and wraps, off-frame stars are not drawn
+    stars = ParallaxLayer(velocity=velocity)
     for _ in range(n):
         r = random.uniform(*scale_range)
         x = random.uniform(-spread, spread)
@@ -86,7 +104,8 @@ def ease_out_expo(t: float) -> float:
         return 1.0
     return 1.0 - 2 ** (-10 * t)
 
-def s1_launch(scene: MovingCameraScene):
+@scoped_beat
+def s1_launch(scene: RiggedCameraScene):
     """
     Cinematic liftoff with automatic transition to "space mode":
     - while low (in atmosphere): dense particles, big glow, clouds visible
@@ -121,7 +140,7 @@ def s1_launch(scene: MovingCameraScene):
             c = Circle(radius=r, fill_color=WHITE, fill_opacity=0.0, stroke_opacity=0).move_to([x, y, 0])
             group.add(c)
         return group
-    clouds = make_clouds(n=20)
+    clouds = make_clouds(n=scaled_count(20, minimum=4))
     scene.add(clouds)
 
     glow_layers = VGroup(
@@ -131,19 +150,13 @@ def s1_launch(scene: MovingCameraScene):
     )
     scene.add(glow_layers)
 
-    # particle pool + traced trail
-    particle_count = 120
-    particles = VGroup()
-    for _ in range(particle_count):
-        p = Dot(radius=random.uniform(0.02, 0.06), color=random.choice(["#FF3B00", "#FF6A00", "#FFD24C"]))
-        p.move_to(rocket.get_bottom() + np.array([random.uniform(-0.15, 0.15), random.uniform(-0.08, 0.08), 0]))
-        p.v = np.array([0.0, 0.0, 0.0])
-        p.life = 0.0
-        p.set_opacity(0.0)
-        particles.add(p)
+    # particle pool (array-backed, one image) + traced trail
+    particles = ExhaustParticles(count=scaled_count(2500), resolution_scale=scaled_resolution(0.5),
+                                 seed=random.randrange(2**32)).reset(rocket.get_bottom())
     scene.add(particles)
 
-    trail = TracedPath(lambda: rocket.get_bottom(), stroke_color="#FF6A00", stroke_width=2.0, dissipating_time=3.2)
+    trail = RingTrail(lambda: rocket.get_bottom(), stroke_color="#FF6A00", stroke_width=2.0, dissipating_time=3.2,
+                      chunks=scaled_segments(24, minimum=6))
     scene.add(trail)
 
     # ascent path
@@ -155,7 +168,8 @@ def s1_launch(scene: MovingCameraScene):
 
     # small altitude tracker (optional)
     alt = ValueTracker(start[1])
-    alt_display = always_redraw(lambda: DecimalNumber(int(alt.get_value())).set_color(WHITE).scale(0.6).to_corner(UL).shift(RIGHT * 0.2))
+    alt_display = GlyphCounter(int(alt.get_value())).set_color(WHITE).scale(0.6).to_corner(UL).shift(RIGHT * 0.2)
+    alt_display.add_updater(lambda m: m.set_value(int(alt.get_value())))
     scene.add(alt_display)
 
     # countdown + ignition (kept same behaviour)
@@ -172,20 +186,14 @@ def s1_launch(scene: MovingCameraScene):
                 run_time=0.18,
                 rate_func=rush_from
             )
+            puffs = [(random.uniform(0.75, 0.95), random.uniform(1.2, 2.4), random.uniform(0.25, 1.0)) for _ in clouds]
             scene.play(
-                LaggedStart(*[
-                    c.animate.set_fill(WHITE, opacity=random.uniform(0.75, 0.95)).scale(random.uniform(1.2, 2.4)).shift(UP * random.uniform(0.25, 1.0))
-                    for c in clouds
-                ], lag_ratio=0.02),
+                GroupTween(clouds, fill_color=WHITE, fill_opacity=[p[0] for p in puffs],
+                           scale=[p[1] for p in puffs], shift=[UP * p[2] for p in puffs], lag_ratio=0.02),
                 run_time=0.9,
                 rate_func=ease_out_expo
             )
-            for p in particles:
-                angle = random.uniform(-0.75 * np.pi, -0.25 * np.pi)
-                speed = random.uniform(3.2, 7.8)
-                p.v = np.array([speed * np.cos(angle), speed * np.sin(angle), 0.0]) * 0.35
-                p.life = random.uniform(0.8, 1.6)
-                p.set_opacity(1.0)
+            particles.burst()
             scene.play(rocket.flames.animate.set_scale(2.5), run_time=0.14)
             scene.play(scene.camera.frame.animate.scale(0.96), run_time=0.12)
             scene.wait(0.06)
@@ -198,34 +206,11 @@ def s1_launch(scene: MovingCameraScene):
 
     # particle physics using the mutable spawn_prob
     def particle_emitter(dt):
-        nozzle = rocket.get_bottom()
         # update altitude tracker
         alt.set_value(rocket.get_center()[1])
-        for p in particles:
-            if p.life > 0:
-                p.move_to(p.get_center() + p.v * dt)
-                p.v = p.v + np.array([random.uniform(-0.8, 0.8), random.uniform(0.8, 2.4), 0.0]) * dt * 0.6
-                p.life -= dt
-                p.set_opacity(max(0.0, p.life / 1.6))
-            else:
-                if random.random() < spawn_prob[0]:
-                    p.move_to(nozzle + np.array([random.uniform(-0.12, 0.12), random.uniform(-0.06, 0.06), 0]))
-                    angle = random.uniform(-0.6 * np.pi, -0.4 * np.pi)
-                    speed = random.uniform(2.6, 5.5)
-                    p.v = np.array([speed * np.cos(angle), speed * np.sin(angle), 0.0]) * 0.45
-                    p.life = random.uniform(0.6, 1.1)
-                    p.set_opacity(random.uniform(0.7, 1.0))
-
-    # camera shake and flame liveliness updaters (unchanged)
-    shake_strength = 0.045
-    def camera_shake(m, dt):
-        t = scene.time
-        decay = max(0.0, 1.0 - (t - 0.2) * 0.15)
-        offset = np.array([random.uniform(-shake_strength, shake_strength), random.uniform(-shake_strength, shake_strength), 0.0]) * decay
-        rot = 0.004 * np.sin(50 * t) * decay
-        m.move_to((apex - UP * 3) + offset)
-        m.set_angle(rot)
+        particles.step(dt, rocket.get_bottom(), spawn_prob[0])
 
+    # flame liveliness updater (camera shake is handled by the scene's rig)
     def flame_live(m, dt):
         # Make flame longer / tighter as rocket reaches space (space-mode increases core flare)
         base = 1.9 + 0.2 * np.sin(scene.time * 28)
@@ -261,10 +246,10 @@ def s1_launch(scene: MovingCameraScene):
                 sub.set_fill(sub.get_fill_color(), opacity=1.0)
         # optionally restore some atmosphere if rocket falls back (not used here)
 
-    # attach updaters
-    scene.camera.frame.add_updater(camera_shake)
+    # attach updaters; the shake is a seeded function of scene time, fading from ignition
+    shake = scene.rig.add_shake(start=scene.time, strength=0.045, decay=0.15, roll=0.004, roll_freq=50)
     rocket.add_updater(flame_live)
-    scene.add_updater(lambda dt: particle_emitter(dt))
+    scene.add_updater(particle_emitter)
     scene.add_updater(flight_phase_updater)
 
     # ascend
@@ -281,18 +266,19 @@ def s1_launch(scene: MovingCameraScene):
     scene.wait(0.6)
 
     # cleanup: remove updaters and temporary objects
-    scene.camera.frame.remove_updater(camera_shake)
+    scene.rig.end_shake(shake, scene.time)
     rocket.clear_updaters()
-    scene.remove_updater(lambda dt: particle_emitter(dt))  # best-effort remove
+    scene.remove_updater(particle_emitter)
     scene.remove_updater(flight_phase_updater)
     scene.play(
-        LaggedStart(*[g.animate.set_opacity(0).scale(0.9) for g in glow_layers], lag_ratio=0.02),
-        LaggedStart(*[p.animate.set_opacity(0).shift(DOWN * 0.8) for p in particles], lag_ratio=0.003),
+        GroupTween(glow_layers, opacity=0, scale=0.9, lag_ratio=0.02),
+        particles.animate.set_opacity(0).shift(DOWN * 0.8),
         run_time=1.0
     )
     scene.play(Restore(scene.camera.frame), run_time=1.0)
     scene.remove(trail, path, particles, clouds, pad, glow_layers)
 
+@scoped_beat
 def s2_refuel_orbit(scene: MovingCameraScene):  # 25–40s
     # Set up a planet to orbit around
     planet = Circle(radius=0.9, fill_color="#6B4F3A", fill_opacity=1).to_edge(RIGHT).shift(UP * 0.6)
@@ -304,7 +290,7 @@ def s2_refuel_orbit(scene: MovingCameraScene):  # 25–40s
     rocket.move_to(LEFT * 4 + DOWN * 1)
     scene.add(rocket)
 
-    # Traced path for the orbital pass (TracedPath)
+    # Traced path for the orbital pass (ring-buffer trail)
     orbit_center = planet.get_center()
     r = 1.6
     t = ValueTracker(0.0)
@@ -335,14 +321,15 @@ def s2_refuel_orbit(scene: MovingCameraScene):  # 25–40s
     scene.add(approach_path)
 
     # HUD: docking counter
-    dock_val = DecimalNumber(0, num_decimal_places=0).to_corner(UR)
+    dock_val = GlyphCounter(0, num_decimal_places=0).to_corner(UR)
     dock_label = Text("DOCK %", font_size=24).next_to(dock_val, DOWN, buff=0.05)
     scene.add(dock_val, dock_label)
 
     dock_val.add_updater(lambda d: d.set_value(int(t.get_value() * 100)))
 
     # Run approach then orbit once with traced trail
-    traced = TracedPath(rocket.get_center, stroke_color=ORANGE, stroke_width=3, dissipating_time=4)
+    traced = RingTrail(rocket.get_center, stroke_color=ORANGE, stroke_width=3, dissipating_time=4,
+                       chunks=scaled_segments(24, minimum=6))
     scene.add(traced)
 
     # Approach animation along approach_path
@@ -351,10 +338,10 @@ def s2_refuel_orbit(scene: MovingCameraScene):  # 25–40s
     rocket.add_updater(orbit_pos)
     scene.play(t.animate.set_value(1.0), run_time=5.0, rate_func=linear)
     scene.wait(0.4)
-    # cleanup
+    # cleanup (the orbit trail goes too: with its updater detached it would freeze on screen)
     rocket.clear_updaters()
     dock_val.clear_updaters()
-    scene.remove(approach_path)
+    scene.remove(approach_path, traced)
 
 def make_dust_puffs(center, n=12, spread=0.6):
     group = VGroup()
@@ -366,36 +353,20 @@ def make_dust_puffs(center, n=12, spread=0.6):
         group.add(c)
     return group
 
-def add_film_grain(scene, intensity=0.06, count=420):
+def add_film_grain(scene, intensity=0.06, seed=0):
     """
-    Add subtle film grain overlay. Uses camera frame size (fallbacks to safe defaults)
-    to position grains in scene coordinates. Returns the VGroup of grain dots.
+    Add an animated film grain overlay: windows into one tiled, seeded noise tile,
+    shown as one image pinned to the camera frame. Returns the overlay.
+    Draft renders skip the effect and get an invisible stand-in to animate and remove.
     """
-    grains = VGroup()
-    # get scene frame dimensions in scene units (safe fallback)
-    frame = getattr(scene, "camera", None)
-    if frame is not None and hasattr(scene.camera.frame, "get_width"):
-        width = float(scene.camera.frame.get_width())
-        height = float(scene.camera.frame.get_height())
-    else:
-        # safe defaults (approx typical Manim units)
-        width, height = 14.0, 8.0
-
-    # limit count to avoid huge slowdowns when called repeatedly
-    count = min(count, 800)
-
-    for _ in range(count):
-        x = random.uniform(-width / 2, width / 2)
-        y = random.uniform(-height / 2, height / 2)
-        r = random.uniform(0.002, 0.01) * max(width, height) * 0.02  # scale radius to frame size a bit
-        d = Dot(point=[x, y, 0], radius=r, color=WHITE)
-        d.set_opacity(random.uniform(0.002, intensity))
-        grains.add(d)
-
-    grains.set_z_index(50)
-    scene.add(grains)
-    return grains
-
+    if not effects_enabled():
+        return VectorizedPoint()
+    grain = FilmGrainOverlay(scene.camera.frame, intensity=intensity, seed=seed)
+    grain.set_z_index(50)
+    scene.add(grain)
+    return grain
+
+@scoped_beat
 def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic transfer + landing
     # Wide setup: Earth left, Mars right (Mars with landing surface)
     scene.camera.frame.save_state()
@@ -424,14 +395,17 @@ def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic tr
     scene.add(transfer_path)
 
     # traced trail for long transfer
-    tracer = TracedPath(lambda: rocket.get_center(), stroke_color="#FFD57A", stroke_width=3, dissipating_time=5.0)
+    tracer = RingTrail(lambda: rocket.get_center(), stroke_color="#FFD57A", stroke_width=3, dissipating_time=5.0,
+                       chunks=scaled_segments(24, minimum=6))
     scene.add(tracer)
 
     # HUD: distance & ETA (ValueTrackers)
     dist = ValueTracker(100.0)
     eta = ValueTracker(240.0)
-    dist_display = always_redraw(lambda: DecimalNumber(dist.get_value(), num_decimal_places=0).to_corner(UR))
-    eta_display = always_redraw(lambda: DecimalNumber(int(eta.get_value())).to_corner(UR).shift(DOWN * 0.6))
+    dist_display = GlyphCounter(dist.get_value(), num_decimal_places=0, align=RIGHT).to_corner(UR)
+    eta_display = GlyphCounter(int(eta.get_value()), align=RIGHT).to_corner(UR).shift(DOWN * 0.6)
+    dist_display.add_updater(lambda m: m.set_value(dist.get_value()))
+    eta_display.add_updater(lambda m: m.set_value(int(eta.get_value())))
     scene.add(dist_display, eta_display)
 
     # Move rocket along transfer path with slow acceleration look
@@ -458,12 +432,12 @@ def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic tr
     scene.add(descent_path)
 
     # Add film grain subtly for realism
-    grain = add_film_grain(scene, intensity=0.03, count=220)
+    grain = add_film_grain(scene, intensity=0.03)
     grain.set_opacity(0.0)
     scene.play(grain.animate.set_opacity(1.0), run_time=0.8)
 
     # make dust puffs at landing area (hidden)
-    dusts = make_dust_puffs(landing_point, n=12, spread=0.6)
+    dusts = make_dust_puffs(landing_point, n=scaled_count(12, minimum=4), spread=0.6)
     scene.add(dusts)
 
     # approach along descent_path with traced descent trail and camera zoom to Mars
@@ -480,15 +454,15 @@ def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic tr
     # Landing impact: puff/dust spread + small camera bounce + energy drain HUD
     # Energy tracker to mimic fuel/energy draining on landing
     energy = ValueTracker(100.0)
-    energy_display = always_redraw(lambda: DecimalNumber(energy.get_value(), num_decimal_places=0).to_corner(DL))
+    energy_display = GlyphCounter(energy.get_value(), num_decimal_places=0).to_corner(DL)
+    energy_display.add_updater(lambda m: m.set_value(energy.get_value()))
     scene.add(energy_display)
 
     # animate dust puffs (scale + fade out)
+    spread = [(random.uniform(1.8, 3.2), random.uniform(0.2, 0.9)) for _ in dusts]
     scene.play(
-        LaggedStart(*[
-            d.animate.set_fill("#D98A6A", opacity=0.95).scale(random.uniform(1.8, 3.2)).shift(UP * random.uniform(0.2, 0.9)).set_opacity(0.95)
-            for d in dusts
-        ], lag_ratio=0.06),
+        GroupTween(dusts, fill_color="#D98A6A", opacity=0.95, scale=[p[0] for p in spread],
+                   shift=[UP * p[1] for p in spread], lag_ratio=0.06),
         energy.animate.set_value(12.0),
         scene.camera.frame.animate.shift(UP * 0.06).scale(0.98),
         run_time=1.0,
@@ -505,7 +479,8 @@ def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic tr
     ])
     sparks.set_opacity(0.0)
     scene.add(sparks)
-    scene.play(LaggedStart(*[s.animate.set_opacity(1.0).shift(UP * random.uniform(0.06, 0.18)).fade(0.9) for s in sparks], lag_ratio=0.03), run_time=0.9)
+    # set_opacity(1.0).fade(0.9): the sparks end at 10% opacity
+    scene.play(GroupTween(sparks, opacity=0.1, shift=[UP * random.uniform(0.06, 0.18) for _ in sparks], lag_ratio=0.03), run_time=0.9)
 
     # final settle: fade out tracer, keep rocket on surface, small camera pullback to reveal Mars surface
     scene.play(
@@ -519,26 +494,16 @@ def s3_transfer_or_mars(scene: MovingCameraScene):  # replaced with cinematic tr
     rocket.clear_updaters()
     scene.remove(tracer, transfer_path, descent_path)
     # gently fade grain and sparks
-    scene.play(grain.animate.set_opacity(0.0), LaggedStart(*[s.animate.set_opacity(0.0) for s in sparks], lag_ratio=0.02), run_time=0.9)
+    scene.play(grain.animate.set_opacity(0.0), GroupTween(sparks, opacity=0.0, lag_ratio=0.02), run_time=0.9)
+    scene.remove(grain)  # fully transparent now; no need to keep compositing it
 
     # keep rocket on Mars surface for the outro or next beat
     scene.camera.frame.restore()
 
 def create_asteroid_belt(n=36, radius_range=(2.6, 4.2), spread_y=1.2, color="#A88B6D"):
-    belt = VGroup()
-    for i in range(n):
-        angle = random.uniform(0, TAU)
-        r = random.uniform(*radius_range)
-        x = r * np.cos(angle)
-        y = r * np.sin(angle) + random.uniform(-spread_y, spread_y)
-        size = random.uniform(0.04, 0.14)
-        rock = Ellipse(width=size * random.uniform(0.6, 1.4), height=size * random.uniform(0.4, 1.0),
-                       fill_color=color, fill_opacity=1, stroke_opacity=0).move_to([x, y, 0])
-        rock.rotate(random.uniform(0, TAU))
-        belt.add(rock)
-    # gentle rotation to simulate belt motion
-    belt.add_updater(lambda m, dt: m.rotate(0.0008 * dt))
-    return belt
+    # every rock orbits on its own (inner rocks faster), all drawn as one image
+    return AsteroidBelt(n=n, radius_range=radius_range, spread_y=spread_y, color=color,
+                        seed=random.randrange(2**32))
 
 def create_gas_giant(center=RIGHT * 4 + UP * 0.6, base_radius=0.9, band_colors=("#C47B2E", "#D89B5A")):
     layers = VGroup()
@@ -549,8 +514,7 @@ def create_gas_giant(center=RIGHT * 4 + UP * 0.6, base_radius=0.9, band_colors=(
         c = Circle(radius=r, fill_color=color, fill_opacity=0.85 - i * 0.08, stroke_opacity=0).move_to(center)
         c.rotate(i * 0.07)
         layers.add(c)
-    # subtle tilt and slow rotation
-    layers.add_updater(lambda m, dt: m.rotate(0.0006 * dt))
+    # concentric circles look the same at any rotation, so the bands need no updater
     return layers
 
 def create_additional_stations(scene: MovingCameraScene, count=2):
@@ -565,7 +529,7 @@ def create_additional_stations(scene: MovingCameraScene, count=2):
         panel_l = Rectangle(width=0.36, height=0.08, fill_color="#2F6B8F", fill_opacity=0.95).next_to(core, LEFT, buff=0.06)
         panel_r = Rectangle(width=0.36, height=0.08, fill_color="#2F6B8F", fill_opacity=0.95).next_to(core, RIGHT, buff=0.06)
         panels = VGroup(panel_l, panel_r)
-        st = VGroup(core, panels).move_to(pos)
+        st = BakedGroup(core, panels).move_to(pos)
 
         # Updater uses scene.time via closure; signature (m, dt) expected by Manim
         def station_updater(m, dt, t0=random.uniform(0, 6)):
@@ -584,10 +548,10 @@ def create_space_vignette(scene: MovingCameraScene):
     Adds: layered starfields, sun glow, Earth, Mars, gas giant, asteroid belt,
     multiple stations & satellites with subtle parallax updaters. Designed to be error-less.
     """
-    # star layers
-    far = make_parallax_stars(n=110, spread=34, color="#DCEEFF", scale_range=(0.02, 0.045))
-    mid = make_parallax_stars(n=72, spread=22, color="#EAF6FF", scale_range=(0.03, 0.07))
-    near = make_parallax_stars(n=44, spread=16, color="#FFFFFF", scale_range=(0.05, 0.11))
+    # star layers (scroll offsets are applied at draw time and wrap, see culling.ParallaxLayer)
+    far = make_parallax_stars(n=scaled_count(110), spread=34, color="#DCEEFF", scale_range=(0.02, 0.045), velocity=LEFT * 0.0018)
+    mid = make_parallax_stars(n=scaled_count(72), spread=22, color="#EAF6FF", scale_range=(0.03, 0.07), velocity=LEFT * 0.0042)
+    near = make_parallax_stars(n=scaled_count(44), spread=16, color="#FFFFFF", scale_range=(0.05, 0.11), velocity=LEFT * 0.009)
     far.set_z_index(0); mid.set_z_index(1); near.set_z_index(2)
 
     # sun with layered glows
@@ -615,23 +579,20 @@ def create_space_vignette(scene: MovingCameraScene):
     main_station.set_z_index(3)
 
     extra_stations = create_additional_stations(scene, count=2)
-    sats = VGroup(*[Dot(point=np.array([random.uniform(-6, 6), random.uniform(-3, 4), 0]),
-                        radius=random.uniform(0.02, 0.06), color="#E9EEF8") for _ in range(10)])
+    sats = ParallaxLayer(*[Dot(point=np.array([random.uniform(-6, 6), random.uniform(-3, 4), 0]),
+                        radius=random.uniform(0.02, 0.06), color="#E9EEF8") for _ in range(scaled_count(10))],
+                         velocity=LEFT * 0.0024)
     sats.set_z_index(2)
 
     # asteroid belt between planets for cinematic interest
-    belt = create_asteroid_belt(n=40, radius_range=(2.6, 4.0), spread_y=1.1)
+    belt = create_asteroid_belt(n=scaled_count(40), radius_range=(2.6, 4.0), spread_y=1.1)
     belt.set_z_index(1)
 
-    # subtle parallax updaters
-    far.add_updater(lambda m, dt: m.shift(LEFT * 0.0018 * dt))
-    mid.add_updater(lambda m, dt: m.shift(LEFT * 0.0042 * dt))
-    near.add_updater(lambda m, dt: m.shift(LEFT * 0.009 * dt))
-    sats.add_updater(lambda m, dt: m.shift(LEFT * 0.0024 * dt))
+    # subtle station drift
     main_station.add_updater(lambda m, dt: m.rotate(0.001 * dt))
 
     # assemble
-    bg_group = VGroup(far, mid, near, sun_group, earth, earth_shade, mars, mars_ring, gas, belt, main_station, extra_stations, sats)
+    bg_group = Group(far, mid, near, sun_group, earth, earth_shade, mars, mars_ring, gas, belt, main_station, extra_stations, sats)
     scene.add(bg_group)
     return bg_group
 
@@ -649,7 +610,7 @@ def load_project_logo(path="assets/imranslab_logo.svg", fallback_text="Imrans La
     except Exception:
         return Text(fallback_text, font_size=48, weight=BOLD).set_color(WHITE)
 
-class MasterScene(MovingCameraScene):
+class MasterScene(UpdaterProfilingMixin, RiggedCameraScene):
     def construct(self):
         self.camera.frame.save_state()
         self.camera.background_color = "#07162a"
@@ -657,11 +618,15 @@ class MasterScene(MovingCameraScene):
         # add persistent space vignette (planets, sun, station, parallax stars)
         space_bg = create_space_vignette(self)
 
-        # sequence of beats
+        # sequence of beats (one manim section each, so profiles can be split per beat)
+        self.next_section("s1_launch")
         s1_launch(self)
+        self.next_section("s2_refuel_orbit")
         s2_refuel_orbit(self)
+        self.next_section("s3_transfer_or_mars")
         s3_transfer_or_mars(self)
 
+        self.next_section("outro")
         # Outro using Imrans Lab logo + credit (place assets/imranslab_logo.svg in project)
         logo = load_project_logo("assets/imranslab_logo.svg", fallback_text="Imrans Lab")
         credit = Text("developed by mozahid", font_size=28).set_color("#E6E6E6").to_edge(DOWN).shift(RIGHT*0.6)
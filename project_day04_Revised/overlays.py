@@ -0,0 +1,153 @@
+# overlays.py
+"""
+Full-frame overlays that are computed once as images and pinned to the camera frame.
+"""
+from manim import *
+from manim import config
+import numpy as np
+
+_VIGNETTE_CACHE = {}
+_GRAIN_TILES = {}
+GRAIN_TILE_LIMIT = 8  # tiles kept (256 KB each at the default size)
+
+
+def radial_vignette_rgba(pixel_width, pixel_height, inner_alpha=0.57, outer_alpha=0.78, falloff_start=0.45,
+                         grade_color="#0b1020", grade_opacity=0.02):
+    """
+    RGBA radial vignette with the colour grade folded in, cached per resolution.
+
+    Darkness is ``inner_alpha`` inside ``falloff_start`` (as a fraction of the
+    centre-to-corner distance) and eases to ``outer_alpha`` at the corners.
+    The grade tint sits under the black vignette, so both are collapsed into
+    a single straight-alpha layer: one composite instead of seven.
+    """
+    key = (pixel_width, pixel_height, inner_alpha, outer_alpha, falloff_start, str(grade_color), grade_opacity)
+    if key in _VIGNETTE_CACHE:
+        return _VIGNETTE_CACHE[key]
+
+    ys = (np.arange(pixel_height) + 0.5) / pixel_height * 2 - 1
+    xs = (np.arange(pixel_width) + 0.5) / pixel_width * 2 - 1
+    rho = np.hypot(xs[None, :], ys[:, None]) / np.sqrt(2)
+    s = np.clip((rho - falloff_start) / max(1e-6, 1 - falloff_start), 0.0, 1.0)
+    vignette = inner_alpha + (outer_alpha - inner_alpha) * s * s * (3 - 2 * s)
+
+    # grade (colour c_g, alpha a_g) under black vignette a_v, as one layer (C, A)
+    total = 1 - (1 - grade_opacity) * (1 - vignette)
+    tint = np.asarray(color_to_rgb(grade_color), dtype=float)
+    weight = grade_opacity * (1 - vignette) / np.maximum(total, 1e-9)
+
+    rgba = np.empty((pixel_height, pixel_width, 4), dtype=np.uint8)
+    rgba[..., :3] = np.clip(weight[..., None] * tint * 255, 0, 255).astype(np.uint8)
+    rgba[..., 3] = np.clip(total * 255, 0, 255).astype(np.uint8)
+    _VIGNETTE_CACHE[key] = rgba
+    return rgba
+
+
+class FrameOverlay(ImageMobject):
+    """Image that is re-fitted to the camera frame on every update, so it follows zooms and pans."""
+
+    follows_camera_frame = True
+
+    def __init__(self, pixel_array, frame, **kwargs):
+        super().__init__(pixel_array, **kwargs)
+        self.pin_to(frame)
+        self.add_updater(lambda m, dt: m.pin_to(frame))
+
+    def pin_to(self, frame):
+        self.stretch_to_fit_width(frame.width)
+        self.stretch_to_fit_height(frame.height)
+        self.move_to(frame.get_center())
+        return self
+
+
+class VignetteOverlay(FrameOverlay):
+    """Radial vignette + grade generated at the output resolution."""
+
+    def __init__(self, frame, **vignette_kwargs):
+        pixels = radial_vignette_rgba(config.pixel_width, config.pixel_height, **vignette_kwargs)
+        super().__init__(pixels, frame)
+
+
+def film_grain_tile(size=256, intensity=0.06, seed=0):
+    """
+    One seeded, tileable grain tile (``size`` x ``size`` RGBA), cached.
+
+    Each pixel gets Gaussian noise: white specks for positive values, black for
+    negative, with alpha up to ``intensity`` by magnitude. Independent per-pixel
+    noise has no structure to break at the tile edges, so it tiles seamlessly.
+    The cache keeps the ``GRAIN_TILE_LIMIT`` most recent tiles.
+    """
+    key = (size, intensity, seed)
+    if key in _GRAIN_TILES:
+        _GRAIN_TILES[key] = _GRAIN_TILES.pop(key)  # most recently used last
+        return _GRAIN_TILES[key]
+    noise = np.random.default_rng(seed).standard_normal((size, size), dtype=np.float32)
+    rgba = np.empty((size, size, 4), dtype=np.uint8)
+    rgba[..., :3] = np.where(noise > 0, 255, 0).astype(np.uint8)[..., None]
+    rgba[..., 3] = (np.minimum(np.abs(noise) / 2.5, 1.0) * intensity * 255).astype(np.uint8)
+    _GRAIN_TILES[key] = rgba
+    while len(_GRAIN_TILES) > GRAIN_TILE_LIMIT:
+        _GRAIN_TILES.pop(next(iter(_GRAIN_TILES)))
+    return rgba
+
+
+class FilmGrainOverlay(FrameOverlay):
+    """
+    Animated film grain as one image layer.
+
+    One small tile is repeated to cover the output resolution, plus one tile of
+    margin. Each grain frame is a window into that, at a seeded random offset,
+    so it is a view, not a new frame. It cycles through ``variants`` offsets at
+    ``grain_fps``, in a scrambled order so the loop is not noticeable.
+    ``set_opacity`` scales the grain's alpha into one reused buffer instead of
+    flattening it.
+    """
+
+    def __init__(self, frame, intensity=0.06, variants=12, grain_fps=24, seed=0, tile_size=256):
+        width, height = config.pixel_width, config.pixel_height
+        tile = film_grain_tile(tile_size, intensity, seed)
+        reps = (-(-height // tile_size) + 1, -(-width // tile_size) + 1, 1)
+        self._tiled = np.tile(tile, reps)
+        self._offsets = np.random.default_rng([seed, variants]).integers(tile_size, size=(variants, 2))
+        self._size = (height, width)
+        self._faded = None
+        self.intensity = intensity
+        self.variants = variants
+        self.grain_fps = grain_fps
+        self.grain_seed = seed
+        self.layer_opacity = 1.0
+        self.time = 0.0
+        self._index = 0
+        super().__init__(self._grain(0), frame)
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def _grain(self, index):
+        (dy, dx), (height, width) = self._offsets[index], self._size
+        return self._tiled[dy:dy + height, dx:dx + width]
+
+    def _show(self, index):
+        pixels = self._grain(index)
+        if self.layer_opacity < 1.0:
+            if self._faded is None:
+                self._faded = np.empty_like(pixels)
+            self._faded[..., :3] = pixels[..., :3]
+            np.multiply(pixels[..., 3], self.layer_opacity, out=self._faded[..., 3], casting="unsafe")
+            pixels = self._faded
+        self.pixel_array = pixels
+        self._index = index
+        return self
+
+    def advance(self, dt):
+        self.time += dt
+        tick = int(self.time * self.grain_fps)
+        index = (tick * 7 + self.grain_seed) % self.variants
+        if index != self._index:
+            self._show(index)
+        return self
+
+    def set_opacity(self, alpha):
+        self.layer_opacity = float(alpha)
+        return self._show(self._index)
+
+    def fade(self, darkness=0.5, family=True):
+        return self.set_opacity(1.0 - darkness)
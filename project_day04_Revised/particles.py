@@ -0,0 +1,86 @@
+# particles.py
+"""
+Array-backed particle systems drawn through a single DotCloudLayer image.
+"""
+from manim import *
+from manim import config
+import numpy as np
+
+from dotcloud import DotCloudLayer, as_rgb_array
+
+
+class ExhaustParticles(DotCloudLayer):
+    """
+    Pooled rocket exhaust.
+
+    Position, velocity, life and opacity are per-particle arrays. ``step``
+    integrates live particles, emits into dead slots at the nozzle and fades
+    everything in one vectorized pass. The canvas is re-fitted to the visible
+    particles every step, so it stays plume-sized while the rocket climbs.
+    Rendered at ``resolution_scale`` of the output; the plume is soft anyway.
+    """
+
+    def __init__(self, count=2500, radius_range=(0.015, 0.045), colors=("#FF3B00", "#FF6A00", "#FFD24C"),
+                 max_life=1.6, resolution_scale=0.5, seed=None, **kwargs):
+        rng = np.random.default_rng(seed)
+        radii = rng.uniform(*radius_range, count)
+        palette = as_rgb_array(list(colors), len(colors))
+        rgb = palette[rng.integers(len(colors), size=count)]
+        ppu = config.pixel_height / config.frame_height * resolution_scale
+        super().__init__(np.zeros((count, 3)), radii, colors=rgb, opacities=0.0,
+                         bounds=(-0.5, 0.5, -0.5, 0.5), pixels_per_unit=ppu, **kwargs)
+        self.rng = rng
+        self.velocities = np.zeros((count, 3))
+        self.life = np.zeros(count)
+        self.max_life = max_life
+
+    def _jitter(self, n, spread_x, spread_y):
+        return np.column_stack([self.rng.uniform(-spread_x, spread_x, n), self.rng.uniform(-spread_y, spread_y, n), np.zeros(n)])
+
+    def _launch(self, mask, angle_range, speed_range, life_range, speed_scale):
+        n = int(mask.sum())
+        angle = self.rng.uniform(*angle_range, n)
+        speed = self.rng.uniform(*speed_range, n)
+        self.velocities[mask] = np.column_stack([speed * np.cos(angle), speed * np.sin(angle), np.zeros(n)]) * speed_scale
+        self.life[mask] = self.rng.uniform(*life_range, n)
+
+    def reset(self, nozzle, spread=(0.15, 0.08)):
+        """Park every particle, dead and invisible, around ``nozzle``."""
+        self.centers[:] = np.asarray(nozzle) + self._jitter(len(self.centers), *spread)
+        self.velocities[:] = 0.0
+        self.life[:] = 0.0
+        self.opacities[:] = 0.0
+        return self.redraw()
+
+    def burst(self, angle_range=(-0.75 * PI, -0.25 * PI), speed_range=(3.2, 7.8), life_range=(0.8, 1.6), speed_scale=0.35):
+        """Ignition: every particle is launched from where it sits, at full opacity."""
+        everyone = np.ones(len(self.centers), dtype=bool)
+        self._launch(everyone, angle_range, speed_range, life_range, speed_scale)
+        self.opacities[:] = 1.0
+        return self.redraw()
+
+    def step(self, dt, nozzle, spawn_prob):
+        """Advance by ``dt``; each dead particle respawns at ``nozzle`` with probability ``spawn_prob``."""
+        if dt <= 0:
+            return self
+        live = self.life > 0
+        n = int(live.sum())
+        self.centers[live] += self.velocities[live] * dt
+        self.velocities[live, 0] += self.rng.uniform(-0.8, 0.8, n) * dt * 0.6
+        self.velocities[live, 1] += self.rng.uniform(0.8, 2.4, n) * dt * 0.6
+        self.life[live] -= dt
+
+        spawn = ~live & (self.rng.random(len(live)) < spawn_prob)
+        if spawn.any():
+            self.centers[spawn] = np.asarray(nozzle) + self._jitter(int(spawn.sum()), 0.12, 0.06)
+            self._launch(spawn, (-0.6 * PI, -0.4 * PI), (2.6, 5.5), (0.6, 1.1), 0.45)
+        self.opacities = np.clip(self.life / self.max_life, 0.0, 1.0)
+        return self.redraw()
+
+    def redraw(self):
+        """Fit the canvas around the visible particles and splat them."""
+        visible = self.opacities > 0
+        pts = self.centers[visible] if visible.any() else self.centers[:1]
+        pad = self.radii.max() + 2.0 / self.pixels_per_unit
+        self.set_bounds((pts[:, 0].min() - pad, pts[:, 0].max() + pad, pts[:, 1].min() - pad, pts[:, 1].max() + pad))
+        return self.refresh(moved=True)
@@ -0,0 +1,62 @@
+# quality.py
+"""
+Render-quality tiers shared by every factory: ``draft``, ``preview`` and ``final``.
+
+The tier comes from ``RENDER_TIER`` when it is set, and otherwise follows
+the manim quality flag: ``-ql`` renders draft, ``-qm`` preview, and ``-qh``
+and above final. So ``manim -ql main.py MasterScene`` is a fast draft without
+editing any numbers, and ``RENDER_TIER=final manim -ql ...`` checks the full
+detail at low resolution.
+
+Factories ask for their budgets through ``scaled_count`` (particles, stars,
+dots), ``scaled_segments`` (curve and ring resolution), ``scaled_resolution``
+(raster layers) and ``effects_enabled`` (optional effect layers). The tier is
+read on every call, so a ``tempconfig`` quality change is picked up.
+"""
+from manim import config
+import math
+import os
+
+TIERS = {
+    "draft": dict(count=0.25, segments=0.5, resolution=0.5, effects=False),
+    "preview": dict(count=0.5, segments=0.75, resolution=0.75, effects=True),
+    "final": dict(count=1.0, segments=1.0, resolution=1.0, effects=True),
+}
+
+
+def quality_tier():
+    """Name of the active tier."""
+    name = os.environ.get("RENDER_TIER", "").strip().lower()
+    if name:
+        if name not in TIERS:
+            raise ValueError(f"RENDER_TIER must be one of {', '.join(TIERS)}, not {name!r}")
+        return name
+    if config.pixel_height <= 480:
+        return "draft"
+    if config.pixel_height <= 720:
+        return "preview"
+    return "final"
+
+
+def _factor(key):
+    return TIERS[quality_tier()][key]
+
+
+def scaled_count(n, minimum=1):
+    """Number of particles/stars/dots to build for a final-quality budget of ``n``."""
+    return max(minimum, int(math.ceil(n * _factor("count"))))
+
+
+def scaled_segments(n, minimum=8):
+    """Segment count for a curve or ring drawn with ``n`` segments at final quality."""
+    return max(minimum, int(math.ceil(n * _factor("segments"))))
+
+
+def scaled_resolution(scale=1.0):
+    """Resolution scale for raster layers rendered at ``scale`` at final quality."""
+    return scale * _factor("resolution")
+
+
+def effects_enabled():
+    """Whether optional effect layers (film grain, extra glows) are drawn."""
+    return _factor("effects")
@@ -0,0 +1,74 @@
+# trails.py
+"""
+Fixed-size motion trails.
+
+``RingTrail`` replaces ``TracedPath`` for trails with a ``dissipating_time``.
+Samples go into a ring buffer sized for ``dissipating_time`` at the render
+frame rate, so memory and per-frame work stay constant however long the
+trail runs. Opacity fades linearly with sample age, computed for every
+sample at once and applied to a fixed number of stroke chunks.
+"""
+from manim import *
+from manim import config
+import math
+import numpy as np
+
+
+class RingTrail(VGroup):
+    def __init__(self, traced_point_func, stroke_color=WHITE, stroke_width=2.0, dissipating_time=3.0,
+                 stroke_opacity=1.0, chunks=24, max_points=None, **kwargs):
+        super().__init__(**kwargs)
+        self.traced_point_func = traced_point_func
+        self.dissipating_time = float(dissipating_time)
+        self.trail_opacity = stroke_opacity
+        if max_points is None:
+            max_points = int(math.ceil(self.dissipating_time * config.frame_rate)) + 2
+        self._positions = np.zeros((max_points, 3))
+        self._stamps = np.zeros(max_points)
+        self._head = 0  # next slot to write
+        self._count = 0
+        self.time = 0.0
+        for _ in range(chunks):
+            self.add(VMobject(stroke_color=stroke_color, stroke_width=stroke_width, stroke_opacity=stroke_opacity))
+        self.push(traced_point_func())
+        self.add_updater(lambda m, dt: m.update_trail(dt))
+
+    def push(self, point):
+        cap = len(self._stamps)
+        self._positions[self._head] = point
+        self._stamps[self._head] = self.time
+        self._head = (self._head + 1) % cap
+        self._count = min(self._count + 1, cap)
+        return self
+
+    def update_trail(self, dt):
+        if dt <= 0:
+            return self
+        self.time += dt
+        self.push(self.traced_point_func())
+        return self.redraw()
+
+    def redraw(self):
+        cap = len(self._stamps)
+        order = (self._head - self._count + np.arange(self._count)) % cap  # oldest first
+        ages = self.time - self._stamps[order]
+        live = order[ages <= self.dissipating_time]
+        pts = self._positions[live]
+        n = len(pts)
+        if n < 2:
+            for chunk in self.submobjects:
+                chunk.points = np.zeros((0, 3))
+            return self
+
+        fade = np.clip(1.0 - (self.time - self._stamps[live]) / self.dissipating_time, 0.0, 1.0) * self.trail_opacity
+        start, end = pts[:-1], pts[1:]
+        step = (end - start) / 3
+        curves = np.stack([start, start + step, end - step, end], axis=1)  # straight cubic per segment
+        bounds = np.linspace(0, n - 1, len(self.submobjects) + 1).round().astype(int)
+        for chunk, a, b in zip(self.submobjects, bounds[:-1], bounds[1:]):
+            if b <= a:
+                chunk.points = np.zeros((0, 3))
+                continue
+            chunk.points = curves[a:b].reshape(-1, 3)
+            chunk.set_stroke(opacity=float(fade[a:b + 1].mean()))
+        return self
@@ -0,0 +1,82 @@
+# updater_scope.py
+"""
+Scoped updaters: everything a beat attaches is detached when the beat ends.
+
+``UpdaterScope`` snapshots the updaters on the scene, the camera frame and
+every mobject on screen when it is entered. On exit, any updater that was
+not there before is removed, whether the beat added it with
+``add_updater``, ``always_redraw`` or a ``TracedPath``. Updaters on mobjects
+that were already removed from the scene no longer run, so they are left
+alone.
+
+With debug on (``UPDATER_SCOPE_DEBUG=1`` or ``debug=True``), every updater
+the beat did not clean up itself is logged before it is removed.
+"""
+from manim import *
+from manim import logger
+import functools
+import os
+
+from profiling import updater_label
+
+
+class UpdaterScope:
+    def __init__(self, scene, name="beat", debug=None):
+        self.scene = scene
+        self.name = name
+        if debug is None:
+            debug = os.environ.get("UPDATER_SCOPE_DEBUG", "0") not in ("", "0")
+        self.debug = debug
+        self._scene_before = []
+        self._before = {}
+
+    def _owners(self):
+        owners = list(self.scene.get_mobject_family_members())
+        frame = getattr(self.scene.camera, "frame", None)
+        if frame is not None:
+            owners.extend(frame.get_family())
+        return owners
+
+    def __enter__(self):
+        self._scene_before = list(self.scene.updaters)
+        self._before = {id(mob): list(mob.updaters) for mob in self._owners() if mob.updaters}
+        return self
+
+    def leaked(self):
+        """(owner, updater) pairs attached since entry; owner is None for scene updaters."""
+        found = [(None, func) for func in self.scene.updaters if func not in self._scene_before]
+        seen = set()
+        for mob in self._owners():
+            if id(mob) in seen or not mob.updaters:
+                continue
+            seen.add(id(mob))
+            before = self._before.get(id(mob), [])
+            found.extend((mob, func) for func in mob.updaters if func not in before)
+        return found
+
+    def close(self):
+        leaked = self.leaked()
+        for owner, func in leaked:
+            if self.debug:
+                where = "scene" if owner is None else type(owner).__name__
+                logger.warning(f"[{self.name}] updater outlived its beat on {where}: {updater_label(func)}")
+            if owner is None:
+                self.scene.remove_updater(func)
+            else:
+                owner.remove_updater(func)
+        return leaked
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def scoped_beat(beat):
+    """Decorator for ``beat(scene, ...)`` functions: run the beat inside an UpdaterScope."""
+
+    @functools.wraps(beat)
+    def run(scene, *args, **kwargs):
+        with UpdaterScope(scene, beat.__name__):
+            return beat(scene, *args, **kwargs)
+
+    return run
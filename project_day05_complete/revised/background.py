@@ -0,0 +1,194 @@
+# background.py
+"""
+Array-backed deep-space background layers for MasterScene.
+
+Every layer here keeps its per-star state in numpy arrays and draws itself
+as a single image, so the camera composites one raster per layer per frame
+instead of hundreds of individually updated Dots.
+"""
+from manim import *
+from manim import config
+import math
+import numpy as np
+
+from dotcloud import DotCloudLayer
+
+
+# --------------------
+# Twinkling starfield
+# --------------------
+class TwinkleStarfield(DotCloudLayer):
+    """
+    Frame-filling starfield whose twinkle runs as one vectorized updater.
+
+    Phase, base opacity and twinkle speed are per-star arrays; each frame
+    advances all phases and recomputes every opacity at once.
+    """
+
+    def __init__(self, n=100, radius=0.02, speed_range=(0.5, 1.5), twinkle_stronger=False, margin=1.0, seed=None, **kwargs):
+        rng = np.random.default_rng(seed)
+        half_w = config.frame_width / 2 + margin
+        half_h = config.frame_height / 2 + margin
+        centers = np.zeros((n, 3))
+        centers[:, 0] = rng.uniform(-half_w, half_w, n)
+        centers[:, 1] = rng.uniform(-half_h, half_h, n)
+
+        rgb = np.tile(np.asarray(color_to_rgb(WHITE), dtype=float), (n, 1))
+        color_choice = rng.random(n)
+        rgb[color_choice < 0.05] = color_to_rgb("#ffd8b3")
+        rgb[color_choice > 0.92] = color_to_rgb("#cfe6ff")
+
+        base_opacity = rng.uniform(0.18, 0.85, n)
+        pad = radius + 0.05
+        super().__init__(centers, radius, colors=rgb, opacities=base_opacity,
+                         bounds=(-half_w - pad, half_w + pad, -half_h - pad, half_h + pad), **kwargs)
+        self.base_opacity = base_opacity
+        self.phase = rng.uniform(0, TAU, n)
+        self.twinkle_speed = rng.uniform(speed_range[0], speed_range[1], n)
+        self.twinkle_amp = 0.6 if twinkle_stronger else 0.45
+        self.add_updater(lambda m, dt: m.twinkle(dt))
+
+    def twinkle(self, dt):
+        self.phase += dt * self.twinkle_speed
+        np.maximum(0.06, self.base_opacity * (0.75 + self.twinkle_amp * np.abs(np.sin(self.phase))), out=self.opacities)
+        return self.refresh()
+
+
+# --------------------
+# Spiral galaxy point cloud
+# --------------------
+class SpiralGalaxy(DotCloudLayer):
+    """
+    Spiral galaxy as one point cloud with per-point radius and opacity.
+
+    The whole cloud shares a single rotation angle. Point offsets from the
+    galaxy center are rotated with one matrix multiply, and only when the
+    accumulated spin would move the outermost point by a visible fraction
+    of a pixel; frames in between just reuse the last raster.
+    """
+
+    def __init__(self, center=np.array([-3.0, 1.2, 0]), arms=2, points=200, spiral_tightness=0.2,
+                 spin_rate=0.0006, color="#cfcfe8", core_color="#fff0c4", seed=None, **kwargs):
+        rng = np.random.default_rng(seed)
+        center = np.asarray(center, dtype=float)
+        t = rng.random(points) * 6.5
+        arm = np.arange(points) % arms
+        r = (0.25 + t * spiral_tightness) * (0.6 + 0.8 * rng.random(points))
+        theta = t + arm * (TAU / arms)
+        offsets = np.zeros((points + 1, 3))
+        offsets[:points, 0] = r * np.cos(theta) + rng.uniform(-0.38, 0.38, points) * 0.04
+        offsets[:points, 1] = r * np.sin(theta) + rng.uniform(-0.38, 0.38, points) * 0.02
+
+        radii = np.append(rng.uniform(0.007, 0.02, points), 0.18)
+        opacities = np.append(np.clip(0.12 + 0.6 * (1 - r / 3.5), 0.0, 1.0), 0.06)
+        rgb = np.tile(np.asarray(color_to_rgb(color), dtype=float), (points + 1, 1))
+        rgb[-1] = color_to_rgb(core_color)  # last point is the soft core
+
+        extent = np.hypot(offsets[:, 0], offsets[:, 1]).max() + radii.max() + 0.05
+        super().__init__(offsets + center, radii, colors=rgb, opacities=opacities,
+                         bounds=(center[0] - extent, center[0] + extent, center[1] - extent, center[1] + extent),
+                         **kwargs)
+        self.galaxy_center = center
+        self.offsets = offsets
+        self.spin_rate = spin_rate
+        self.angle = 0.0
+        self._drawn_angle = 0.0
+        # smallest angle step that moves the outermost point by a quarter pixel
+        self._angle_step = 0.25 / max(extent * self.pixels_per_unit, 1.0)
+        self.add_updater(lambda m, dt: m.spin(dt))
+
+    def spin(self, dt):
+        self.angle += self.spin_rate * dt
+        if abs(self.angle - self._drawn_angle) >= self._angle_step:
+            self.set_angle(self.angle)
+        return self
+
+    def set_angle(self, angle):
+        """Rasterize the cloud at an absolute rotation angle."""
+        c, s = math.cos(angle), math.sin(angle)
+        rot = np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+        self.centers = self.offsets @ rot + self.galaxy_center
+        self.angle = self._drawn_angle = angle
+        return self.refresh(moved=True)
+
+
+# --------------------
+# Comet pool
+# --------------------
+class CometPool(DotCloudLayer):
+    """
+    Fixed-capacity comet emitter drawn as one dot layer.
+
+    Spawn times come from a seeded Poisson process that is generated up
+    front, together with every comet's start point, heading, speed, trail
+    length and lifespan. Comet j always lands in trail slot ``j % capacity``
+    and its state is a closed-form function of its age, so the same seed
+    gives the same comets on every render and no mobjects are created while
+    the scene plays.
+    """
+
+    def __init__(self, rate=0.09, capacity=6, trail_slots=12, horizon=600.0, color="#ffd9b3", seed=None, **kwargs):
+        rng = np.random.default_rng(seed)
+        half_w = config.frame_width / 2
+        half_h = config.frame_height / 2
+
+        # Poisson schedule: exponential gaps between spawns up to the horizon
+        gaps = rng.exponential(1.0 / rate, size=max(1, int(rate * horizon * 2) + 8))
+        spawn = np.cumsum(gaps)
+        spawn = spawn[spawn < horizon]
+        k = len(spawn)
+        angle = rng.uniform(-1.4, -0.2, k)
+        speed = rng.uniform(4.0, 7.0, k)
+        self.spawn_times = spawn
+        self.start = np.column_stack([rng.uniform(-half_w, half_w, k), np.full(k, half_h + 0.3), np.zeros(k)])
+        self.heading = np.column_stack([np.cos(angle) * speed, np.sin(angle) * speed, np.zeros(k)])
+        # drawn as for the full 12-slot trail (same comets at every tier), then fitted to the slots
+        self.trail_length = np.minimum(rng.integers(5, 13, k), trail_slots)
+        self.lifespan = rng.uniform(1.4, 2.6, k)
+        self.capacity = capacity
+        self.trail_slots = trail_slots
+        self.time = 0.0
+
+        n = capacity * trail_slots
+        margin = 1.0
+        super().__init__(np.zeros((n, 3)), 0.02, colors=color, opacities=0.0,
+                         bounds=(-half_w - margin, half_w + margin, -half_h - margin, half_h + margin), **kwargs)
+        self._parked = np.array([self._canvas_origin[0] - 10.0, self._canvas_origin[1] + 10.0, 0.0])
+        self._slot_index = np.arange(trail_slots)
+        self._was_active = False
+        self.set_time(0.0)
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def advance(self, dt):
+        return self.set_time(self.time + dt)
+
+    def set_time(self, t):
+        """Place every live comet for absolute emitter time ``t``."""
+        self.time = t
+        lo = np.searchsorted(self.spawn_times, t - self.lifespan.max(), side="left")
+        hi = np.searchsorted(self.spawn_times, t, side="right")
+        live = np.arange(lo, hi)
+        live = live[t - self.spawn_times[live] < self.lifespan[live]]
+        if len(live) == 0 and not self._was_active:
+            return self
+
+        self.centers[:] = self._parked
+        self.opacities[:] = 0.0
+        i = self._slot_index
+        for j in live[-self.capacity:]:
+            age = t - self.spawn_times[j]
+            length = self.trail_length[j]
+            used = i < length
+            shrink = math.exp(-0.12 * age)
+            # rest trail offsets, centred on the trail midpoint so the shrink matches a group scale
+            rest = -self.heading[j] * 0.03 * i[:, None]
+            rest -= (rest[0] + rest[length - 1]) / 2
+            head = self.start[j] + self.heading[j] * 0.26 * age + np.array([0.0, -0.02 * age * age, 0.0])
+            mid = head - self.heading[j] * 0.03 * (length - 1) / 2
+            rows = slice((j % self.capacity) * self.trail_slots, (j % self.capacity + 1) * self.trail_slots)
+            self.centers[rows] = np.where(used[:, None], mid + rest * shrink, self._parked)
+            self.radii[rows] = 0.02 * (1.0 - 0.02 * i) * shrink
+            fade = max(0.0, 0.95 * (1 - age / self.lifespan[j]))
+            self.opacities[rows] = np.where(used, fade * (1 - i / length), 0.0)
+        self._was_active = len(live) > 0
+        return self.refresh(moved=True)
@@ -0,0 +1,243 @@
+# culling.py
+"""
+View-frustum culling and view-dependent drawing for the camera.
+
+Two kinds of mobjects take part:
+
+* images with ``crop_to_view = True`` (the dot-cloud layers, background
+  plates) - during a capture their pixel array is temporarily replaced by
+  the slice that is actually in view, so the camera resizes and composites
+  only that part; images entirely outside the view are skipped.
+* ``ParallaxLayer`` - a VGroup of stars that scrolls and wraps. Its scroll
+  offset is applied when the points are handed to cairo, so the star
+  points are never rewritten. Each star is drawn at the copy of its position,
+  on a torus of size ``period``, nearest the view centre, so the layer never
+  runs out however far it scrolls or the camera travels. The stars' boxes
+  are bucketed into a uniform ``SpatialGrid`` once, in unscrolled
+  coordinates; each capture asks the grid for the stars overlapping the
+  view's wrapped copies, and the rest are not rasterized.
+
+``FrustumCullingMixin`` goes in front of the Camera class and handles both.
+"""
+from manim import *
+import math
+import numpy as np
+
+
+def view_rect(frame, margin=0.0):
+    """(xmin, xmax, ymin, ymax) covered by the camera frame; conservative for rotated frames."""
+    pts = frame.points
+    return (pts[:, 0].min() - margin, pts[:, 0].max() + margin,
+            pts[:, 1].min() - margin, pts[:, 1].max() + margin)
+
+
+class SpatialGrid:
+    """Uniform grid over axis-aligned boxes; ``query`` returns indices of boxes overlapping a rect."""
+
+    def __init__(self, boxes, cell_size=2.0):
+        self.boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        if not len(self.boxes):
+            self.extent = (0, -1, 0, -1)
+            return
+        cs = self.cell_size
+        ix0 = np.floor(self.boxes[:, 0] / cs).astype(int)
+        ix1 = np.floor(self.boxes[:, 1] / cs).astype(int)
+        iy0 = np.floor(self.boxes[:, 2] / cs).astype(int)
+        iy1 = np.floor(self.boxes[:, 3] / cs).astype(int)
+        for i in range(len(self.boxes)):
+            for ix in range(ix0[i], ix1[i] + 1):
+                for iy in range(iy0[i], iy1[i] + 1):
+                    self.cells.setdefault((ix, iy), []).append(i)
+        self.extent = (ix0.min(), ix1.max(), iy0.min(), iy1.max())
+
+    def query(self, rect):
+        xmin, xmax, ymin, ymax = rect
+        cs = self.cell_size
+        ex0, ex1, ey0, ey1 = self.extent
+        ix0, ix1 = max(ex0, math.floor(xmin / cs)), min(ex1, math.floor(xmax / cs))
+        iy0, iy1 = max(ey0, math.floor(ymin / cs)), min(ey1, math.floor(ymax / cs))
+        if ix0 > ix1 or iy0 > iy1:
+            return np.zeros(0, dtype=int)
+        found = [self.cells[key] for ix in range(ix0, ix1 + 1) for iy in range(iy0, iy1 + 1)
+                 if (key := (ix, iy)) in self.cells]
+        if not found:
+            return np.zeros(0, dtype=int)
+        candidates = np.unique(np.concatenate(found))
+        b = self.boxes[candidates]
+        keep = (b[:, 1] >= xmin) & (b[:, 0] <= xmax) & (b[:, 3] >= ymin) & (b[:, 2] <= ymax)
+        return candidates[keep]
+
+
+def _crop_image_to_view(image, rect):
+    """Swap ``image``'s pixels/points for the in-view slice; returns what to restore, None, or False if outside."""
+    ul, ur, dl = image.points[:3]
+    if not (np.isclose(ul[1], ur[1]) and np.isclose(ul[0], dl[0])):
+        return None  # rotated image: leave it alone
+    left, right = min(ul[0], ur[0]), max(ul[0], ur[0])
+    bottom, top = min(ul[1], dl[1]), max(ul[1], dl[1])
+    pixels = image.pixel_array
+    h, w = pixels.shape[:2]
+    sx, sy = w / (right - left), h / (top - bottom)
+    c0 = max(0, math.floor((rect[0] - left) * sx))
+    c1 = min(w, math.ceil((rect[1] - left) * sx))
+    r0 = max(0, math.floor((top - rect[3]) * sy))
+    r1 = min(h, math.ceil((top - rect[2]) * sy))
+    if c0 == 0 and r0 == 0 and c1 == w and r1 == h:
+        return None
+    if c0 >= c1 or r0 >= r1:
+        return False  # fully outside the view
+    saved = (image, pixels, image.points.copy())
+    new_left, new_right = left + c0 / sx, left + c1 / sx
+    new_top, new_bottom = top - r0 / sy, top - r1 / sy
+    points = image.points.copy()
+    points[:, 0] = new_left + (points[:, 0] - left) / (right - left) * (new_right - new_left)
+    points[:, 1] = new_bottom + (points[:, 1] - bottom) / (top - bottom) * (new_top - new_bottom)
+    image.points = points
+    image.pixel_array = pixels[r0:r1, c0:c1]
+    return saved
+
+
+class ParallaxLayer(VGroup):
+    """
+    Scrolling, wrapping star layer.
+
+    ``velocity`` (units per second) accumulates into ``scroll``, the only
+    per-frame state. ``period`` is the (width, height) of the wrap, by default
+    the extent of the content. It is widened to the view when the camera
+    zooms out, so every star is drawn at most once. Moving the stars
+    (directly or with the layer) is picked up via one anchor point, and
+    rebuilds the centres and the grid.
+    """
+
+    def __init__(self, *stars, velocity=ORIGIN, period=None, cell_size=2.0, **kwargs):
+        super().__init__(*stars, **kwargs)
+        self.velocity = np.array(velocity, dtype=float)
+        self.scroll = np.zeros(3)
+        self.cell_size = cell_size
+        self._period = period
+        self._centers = None
+        self._anchor = None
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def advance(self, dt):
+        self.scroll = self.scroll + self.velocity * dt
+        return self
+
+    def _anchor_point(self):
+        for star in self.submobjects:
+            if len(star.points):
+                return star.points[0]
+        return None
+
+    def _centers_are_stale(self):
+        if self._centers is None or len(self._centers) != len(self.submobjects):
+            return True
+        point = self._anchor_point()
+        return point is not None and not np.allclose(point, self._anchor)
+
+    def refresh_centers(self):
+        stars = self.submobjects
+        self._centers = np.array([star.get_center() for star in stars]).reshape(-1, 3)
+        self._radii = np.array([max(star.width, star.height) / 2 for star in stars])
+        c, r = self._centers, self._radii
+        self._grid = SpatialGrid(np.column_stack([c[:, 0] - r, c[:, 0] + r, c[:, 1] - r, c[:, 1] + r]),
+                                 self.cell_size)
+        # each star's draw_offset is a row of this array, so a frame updates them all at once
+        self._offsets = np.zeros_like(self._centers)
+        for star, offset in zip(stars, self._offsets):
+            star.draw_offset = offset
+        if self._period is None:
+            # the seam gets the average spacing, so it does not show as a gap or a clump
+            extent = np.ptp(self._centers[:, :2], axis=0)
+            self.period = extent * (1 + 1 / max(len(stars) - 1, 1)) + 2 * self._radii.max(initial=0.0)
+        else:
+            self.period = np.asarray(self._period, dtype=float)
+        anchor = self._anchor_point()
+        self._anchor = None if anchor is None else anchor.copy()
+        return self
+
+    def _visible(self, rect, period):
+        """Indices of stars with a wrapped copy overlapping ``rect``."""
+        boxes = self._grid.boxes
+        lo, hi = boxes[:, [0, 2]].min(axis=0), boxes[:, [1, 3]].max(axis=0)
+        view_lo = np.array([rect[0], rect[2]]) - self.scroll[:2]
+        view_hi = np.array([rect[1], rect[3]]) - self.scroll[:2]
+        # the view's copies (one period apart) that can reach the unscrolled content
+        k_lo = np.ceil((view_lo - hi) / period).astype(int)
+        k_hi = np.floor((view_hi - lo) / period).astype(int)
+        found = [self._grid.query((view_lo[0] - kx * period[0], view_hi[0] - kx * period[0],
+                                   view_lo[1] - ky * period[1], view_hi[1] - ky * period[1]))
+                 for kx in range(k_lo[0], k_hi[0] + 1) for ky in range(k_lo[1], k_hi[1] + 1)]
+        return np.concatenate(found) if found else np.zeros(0, dtype=int)
+
+    def prepare_draw(self, rect):
+        """Set each star's ``draw_offset`` for this view; returns the stars outside it."""
+        if self._centers_are_stale():
+            self.refresh_centers()
+        if not len(self._centers):
+            return []
+        center = np.array([(rect[0] + rect[1]) / 2, (rect[2] + rect[3]) / 2])
+        period = np.maximum(self.period, np.array([rect[1] - rect[0], rect[3] - rect[2]]) + 2 * self._radii.max())
+        moved = self._centers[:, :2] + self.scroll[:2]
+        drawn = center + np.mod(moved - center + period / 2, period) - period / 2
+        self._offsets[:, :2] = drawn - self._centers[:, :2]
+        hidden = np.ones(len(self._centers), dtype=bool)
+        hidden[self._visible(rect, period)] = False
+        stars = self.submobjects
+        return [stars[i] for i in np.flatnonzero(hidden)]
+
+
+class FrustumCullingMixin:
+    """Camera mixin: crops ``crop_to_view`` images and places (and culls) ParallaxLayer stars."""
+
+    cull_offscreen = True
+    cull_margin = 0.1
+
+    def _view_rect(self):
+        frame = getattr(self, "frame", None)
+        if frame is not None:
+            return view_rect(frame, self.cull_margin)
+        cx, cy = self.frame_center[:2]
+        hw, hh = self.frame_width / 2 + self.cull_margin, self.frame_height / 2 + self.cull_margin
+        return (cx - hw, cx + hw, cy - hh, cy + hh)
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        rect = self._view_rect()
+        hidden = []
+        cropped = []
+        for mob in extract_mobject_family_members(mobjects, only_those_with_points=False):
+            if isinstance(mob, ParallaxLayer):
+                # always placed, even with culling off: drawing depends on it
+                outside = mob.prepare_draw(rect)
+                if self.cull_offscreen:
+                    hidden.extend(outside)
+            elif not self.cull_offscreen:
+                continue
+            elif getattr(mob, "crop_to_view", False):
+                saved = _crop_image_to_view(mob, rect)
+                if saved is False:
+                    hidden.append(mob)
+                elif saved is not None:
+                    cropped.append(saved)
+        self._culled_ids = {id(m) for m in extract_mobject_family_members(hidden)} if hidden else set()
+        try:
+            super().capture_mobjects(mobjects, **kwargs)
+        finally:
+            self._culled_ids = set()
+            for image, pixels, points in cropped:
+                image.pixel_array = pixels
+                image.points = points
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        culled = getattr(self, "_culled_ids", None)
+        if not culled:
+            return mobjects
+        return [m for m in mobjects if id(m) not in culled]
+
+    def transform_points_pre_display(self, mobject, points):
+        points = super().transform_points_pre_display(mobject, points)
+        offset = getattr(mobject, "draw_offset", None)
+        return points if offset is None else points + offset
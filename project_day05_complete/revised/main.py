@@ -3,9 +3,25 @@ from manim import *
 from manim import config
 import math
 import numpy as np
+import os
 import random
 from typing import List
 
+from background import CometPool, SpiralGalaxy, TwinkleStarfield
+from camera_rig import RiggedCameraScene
+from hud import GlyphCounter
+from overlays import VignetteOverlay
+from plate_cache import load_background_plate
+from profiling import UpdaterProfilingMixin
+from quality import effects_enabled, scaled_count, scaled_resolution, scaled_segments
+from sprites import BakedGroup
+import artifact_store
+
+artifact_store.install()  # Text/glyph SVGs come from the shared store when already rendered
+
+COMET_SEED = 90125
+BACKGROUND_SEED = 2025
+
 # --------------------
 # Small utilities
 # --------------------
@@ -31,106 +47,89 @@ def there_and_back_with_pause(t):
 # --------------------
 # Main cinematic scene (MasterScene)
 # --------------------
-class MasterScene(MovingCameraScene):
+class MasterScene(UpdaterProfilingMixin, RiggedCameraScene):
     """
     Cinematic JWST deployment + L2 explainer with a deep background and
     an Earth->L2 transfer visualization (moving telescope + sunshield orientation).
     """
 
+    # When True, bg_far + nebula + galaxy come from a cached looping raster plate
+    use_background_plate = False
+
+    # Stages in order; each one is a manim section (see render_sections.py)
+    SECTIONS = ("intro", "deployment_sequence", "l2_explainer", "outro")  # l2_explainer includes the transfer
+    # None renders every section; a set of names renders only those. Skipped
+    # sections still run their logic without frames, so a section always starts
+    # from the same foreground, background and camera state as in a full render.
+    render_sections = None
+
     def construct(self):
+        # Seed everything so separately rendered sections build identical objects
+        random.seed(BACKGROUND_SEED)
+        np.random.seed(BACKGROUND_SEED)
         # Build background first (updaters run continuously)
         self.init_background_components()
         self.add_vignette_and_grade()
-        self.intro()
-        self.deployment_sequence()
-        self.l2_explainer()  # includes transfer animation now
-        self.outro()
+        wanted = self.wanted_sections()
+        for name in self.SECTIONS:
+            self.next_section(name, skip_animations=name not in wanted)
+            getattr(self, name)()
+
+    def wanted_sections(self):
+        if self.render_sections is not None:
+            return set(self.render_sections)
+        env = os.environ.get("MASTERSCENE_SECTIONS")
+        if env:
+            return {name.strip() for name in env.split(",")}
+        return set(self.SECTIONS)
 
     # --------------------
     # Background initialization
     # --------------------
     def init_background_components(self):
-        self.bg_far = self.create_starfield(n=140, radius=0.012, speed_range=(0.2, 0.6), z_index=0)
+        if self.use_background_plate:
+            # deep layers only drift/twinkle: render them once into a looping plate
+            self.background_plate = load_background_plate(
+                stars=dict(n=scaled_count(140), radius=0.012, speed_range=(0.2, 0.6)),
+                nebula_blobs=5,
+                galaxy=dict(center=(-3.0, 1.2, 0.0), arms=2, points=scaled_count(220), spiral_tightness=0.25, spin_rate=0.0006),
+                seed=BACKGROUND_SEED,
+                resolution_scale=scaled_resolution(0.5),
+            )
+            self.background_plate.set_z_index(-1)
+            self.deep_layers = [self.background_plate]
+        else:
+            self.bg_far = self.create_starfield(n=140, radius=0.012, speed_range=(0.2, 0.6), z_index=0)
+            self.nebula = self.create_nebula(blobs=5)
+            self.galaxy = self.create_spiral_galaxy(arms=2, points=220, spiral_tightness=0.25)
+            self.deep_layers = [self.bg_far, self.nebula, self.galaxy]
         self.bg_mid = self.create_starfield(n=110, radius=0.018, speed_range=(0.6, 1.4), z_index=1)
         self.bg_near = self.create_starfield(n=60, radius=0.03, speed_range=(1.6, 3.0), z_index=2, twinkle_stronger=True)
 
-        self.nebula = self.create_nebula(blobs=5)
-        self.galaxy = self.create_spiral_galaxy(arms=2, points=220, spiral_tightness=0.25)
-
-        # Comet emitter: schedule updater by attaching it to an invisible Dot (dummy)
-        self._comet_particles = []
-        self._comet_chance = 0.09
-        self._comet_dummy = Dot(radius=0.001, fill_opacity=0)
-        self._comet_dummy.add_updater(self._comet_emitter_updater)
+        # Comet emitter: fixed pool with a seeded, precomputed spawn schedule
+        # (fixed seed so every render shows the same comets)
+        self.comets = CometPool(rate=0.09, trail_slots=scaled_segments(12, minimum=4), seed=COMET_SEED)
 
-        # Camera clock for sway/updater
-        self._camera_clock = ValueTracker(0.0)
-        self.camera.frame.add_updater(self._camera_sway)
+        # Camera sway: closed-form in scene time, applied by the rig at capture
+        # (same peak speeds as the old per-frame sway updater)
+        self.rig.set_sway(x=(0.045 * 6.0 / 0.38, 0.38), y=(0.02 * 6.0 / 0.65, 0.65), roll=(0.004 / 0.12, 0.12))
 
         # Add background objects in z order
-        self.add(self.bg_far)
-        self.add(self.nebula)
-        self.add(self.galaxy)
-        self.add(self.bg_mid)
-        self.add(self.bg_near)
-        # keep the comet dummy active (must be added to the scene)
-        self.add(self._comet_dummy)
+        self.add(*self.background_layers())
 
-    # --------------------
-    # Updater suspend / resume helpers (fix deepcopy/pickle errors)
-    # --------------------
-    def _suspend_critical_updaters(self):
-        try:
-            self.camera.frame.remove_updater(self._camera_sway)
-        except Exception:
-            pass
-        try:
-            self._comet_dummy.remove_updater(self._comet_emitter_updater)
-        except Exception:
-            pass
-
-    def _resume_critical_updaters(self):
-        try:
-            self.camera.frame.add_updater(self._camera_sway)
-        except Exception:
-            pass
-        try:
-            self._comet_dummy.add_updater(self._comet_emitter_updater)
-        except Exception:
-            pass
+    def background_layers(self):
+        return [*self.deep_layers, self.bg_mid, self.bg_near, self.comets]
 
     # --------------------
     # Starfield factory
     # --------------------
     def create_starfield(self, n=100, radius=0.02, speed_range=(0.5, 1.5), z_index=0, twinkle_stronger=False):
-        group = VGroup()
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        for i in range(n):
-            x = random.uniform(-half_w - 1, half_w + 1)
-            y = random.uniform(-half_h - 1, half_h + 1)
-            star = Dot(radius=radius).move_to(np.array([x, y, 0]))
-            star.base_opacity = random.uniform(0.18, 0.85)
-            star.phase = random.uniform(0, TAU)
-            star.twinkle_speed = random.uniform(speed_range[0], speed_range[1])
-            color_choice = random.random()
-            if color_choice < 0.05:
-                star.set_fill("#ffd8b3", opacity=star.base_opacity)
-            elif color_choice > 0.92:
-                star.set_fill("#cfe6ff", opacity=star.base_opacity)
-            else:
-                star.set_fill(WHITE, opacity=star.base_opacity)
-
-            def make_twinkle(s, stronger=twinkle_stronger):
-                def tw(s_obj, dt):
-                    s_obj.phase += dt * s_obj.twinkle_speed
-                    amp = 0.6 if stronger else 0.45
-                    s_obj.set_opacity(max(0.06, s_obj.base_opacity * (0.75 + amp * abs(math.sin(s_obj.phase)))))
-                return tw
-            star.add_updater(make_twinkle(star))
-            group.add(star)
-        group.set_z_index(z_index)
-        return group
+        # one array-backed layer; all stars twinkle in a single vectorized updater
+        # ``n`` is the final-quality budget, scaled down for draft/preview renders
+        field = TwinkleStarfield(n=scaled_count(n), radius=radius, speed_range=speed_range,
+                                 twinkle_stronger=twinkle_stronger, seed=random.randrange(2**32))
+        field.set_z_index(z_index)
+        return field
 
     # --------------------
     # Nebula factory
@@ -157,92 +156,26 @@ class MasterScene(MovingCameraScene):
     # Spiral galaxy factory
     # --------------------
     def create_spiral_galaxy(self, arms=2, points=200, spiral_tightness=0.2):
-        g = VGroup()
-        center = np.array([-3.0, 1.2, 0])
-        base_color = "#cfcfe8"
-        for i in range(points):
-            t = random.random() * 6.5
-            arm = i % arms
-            r = (0.25 + t * spiral_tightness) * (0.6 + 0.8 * random.random())
-            theta = t + (arm * (2*math.pi / arms))
-            x = r * math.cos(theta) + center[0] + random.uniform(-0.38, 0.38) * 0.04
-            y = r * math.sin(theta) + center[1] + random.uniform(-0.38, 0.38) * 0.02
-            d = Dot(radius=random.uniform(0.007, 0.02)).move_to(np.array([x, y, 0]))
-            d.set_fill(base_color, opacity=0.12 + 0.6 * (1 - r / 3.5))
-            d.add_updater(lambda m, dt, c=center: m.rotate(0.0006 * dt, about_point=c))
-            g.add(d)
-        core = Circle(radius=0.18, fill_color="#fff0c4", fill_opacity=0.06, stroke_opacity=0)
-        core.move_to(center)
-        g.add(core)
+        # single point cloud; one shared rotation angle instead of a rotate updater per dot
+        g = SpiralGalaxy(center=np.array([-3.0, 1.2, 0]), arms=arms, points=scaled_count(points),
+                         spiral_tightness=spiral_tightness, seed=random.randrange(2**32))
         g.set_z_index(-0.5)
         return g
 
-    # --------------------
-    # Comet emitter and updater (runs via invisible dot)
-    # --------------------
-    def _comet_emitter_updater(self, m, dt):
-        if random.random() < self._comet_chance * dt:
-            self.spawn_comet()
-        to_remove = []
-        for particle in list(self._comet_particles):
-            particle["t"] += dt
-            p = particle["mobject"]
-            p.shift(particle["v"] * dt)
-            p.shift(np.array([0.0, -0.04 * dt * particle["t"], 0]))
-            new_op = max(0.0, particle["start_opacity"] * (1 - particle["t"]/particle["lifespan"]))
-            p.set_opacity(new_op)
-            p.scale(1 - 0.12 * dt)
-            if particle["t"] >= particle["lifespan"]:
-                to_remove.append(particle)
-        for pr in to_remove:
-            try:
-                self.remove(pr["mobject"])
-            except Exception:
-                pass
-            if pr in self._comet_particles:
-                self._comet_particles.remove(pr)
-
-    def spawn_comet(self):
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        pos = np.array([random.uniform(-half_w, half_w), half_h + 0.3, 0])
-        angle = random.uniform(-1.4, -0.2)
-        speed = random.uniform(4.0, 7.0)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-        length = random.randint(5, 12)
-        group = VGroup()
-        base_color = "#ffd9b3"
-        for i in range(length):
-            d = Dot(radius=0.02 * (1.0 - 0.02*i)).move_to(pos + np.array([-vx*i*0.03, -vy*i*0.03, 0]))
-            d.set_fill(base_color, opacity=0.9 * (1 - i / length))
-            group.add(d)
-            self.add(d)
-        particle_info = {
-            "mobject": group,
-            "v": np.array([vx * 0.26, vy * 0.26, 0]),
-            "t": 0.0,
-            "lifespan": random.uniform(1.4, 2.6),
-            "start_opacity": 0.95,
-        }
-        self._comet_particles.append(particle_info)
-
     # --------------------
     # Vignette / grade / lens flare
     # --------------------
     def add_vignette_and_grade(self):
-        vign = VGroup()
-        steps = 6
-        for i in range(steps):
-            c = Circle(radius=config.frame_width*0.9 - i*0.3, fill_color=BLACK, fill_opacity=0.03 + i*0.04, stroke_opacity=0)
-            vign.add(c)
-        vign.set_z_index(50)
-        self.add(vign)
-        grade = Rectangle(width=config.frame_width+1, height=config.frame_height+1)
-        grade.set_fill("#0b1020", opacity=0.02)
-        grade.set_z_index(49)
-        self.add(grade)
-        self.bloom_container = VGroup()
+        # One precomputed radial vignette + grade image pinned to the camera frame.
+        # inner_alpha matches the old stack of six full-frame circles (~0.57 combined).
+        # Safe to call again after self.clear(): the overlay and bloom container are reused.
+        if getattr(self, "vignette", None) is None:
+            self.vignette = VignetteOverlay(self.camera.frame, inner_alpha=0.57, outer_alpha=0.78)
+            self.vignette.set_z_index(50)
+            self.bloom_container = VGroup()
+        else:
+            self.bloom_container.remove(*self.bloom_container.submobjects)
+        self.add(self.vignette)
         self.add(self.bloom_container)
 
     def lens_flare(self, center_point, scale=1.0):
@@ -252,7 +185,7 @@ class MasterScene(MovingCameraScene):
             c = Circle(radius=r*scale, fill_opacity=0.18/(i+0.9), fill_color=YELLOW, stroke_opacity=0)
             c.move_to(center_point + RIGHT * (0.02 * i))
             flare.add(c)
-        for j in range(4):
+        for j in range(4 if effects_enabled() else 0):  # streaks are skipped in draft renders
             seg = Ellipse(width=0.12*scale*(1+j*0.7), height=0.02*scale).rotate(PI/8 * (j-1))
             seg.set_fill(YELLOW, opacity=0.04)
             seg.move_to(center_point + RIGHT * (0.1 + j*0.06))
@@ -260,18 +193,6 @@ class MasterScene(MovingCameraScene):
         flare.set_z_index(60)
         return flare
 
-    # --------------------
-    # Camera sway
-    # --------------------
-    def _camera_sway(self, frame, dt):
-        self._camera_clock.set_value(self._camera_clock.get_value() + dt)
-        tval = self._camera_clock.get_value()
-        dx = 0.045 * math.sin(tval * 0.38)
-        dy = 0.02 * math.cos(tval * 0.65)
-        rot = 0.004 * math.sin(tval * 0.12)
-        frame.shift(np.array([dx * dt * 6.0, dy * dt * 6.0, 0]))
-        frame.rotate(rot * dt)
-
     # --------------------
     # Intro / Outro
     # --------------------
@@ -298,7 +219,7 @@ class MasterScene(MovingCameraScene):
         self.play(FadeOut(credits), run_time=0.6)
 
     # --------------------
-    # Deployment sequence (unchanged except suspend/resume used earlier)
+    # Deployment sequence
     # --------------------
     def deployment_sequence(self):
         sun = Circle(radius=0.8, fill_color=YELLOW, fill_opacity=1.0).to_edge(LEFT, buff=0.6)
@@ -339,9 +260,9 @@ class MasterScene(MovingCameraScene):
         sec_group.set_z_index(30)
 
         layer_tracker = ValueTracker(0)
-        hud_layers = DecimalNumber(0).add_updater(lambda m: m.set_value(layer_tracker.get_value()))
+        hud_layers = GlyphCounter(0).add_updater(lambda m: m.set_value(layer_tracker.get_value()))
         mission_timer = ValueTracker(0.0)
-        timer_display = DecimalNumber(0, num_decimal_places=1).add_updater(lambda m: m.set_value(mission_timer.get_value()))
+        timer_display = GlyphCounter(0, num_decimal_places=1).add_updater(lambda m: m.set_value(mission_timer.get_value()))
         hud_label = Text("Layers:", font_size=18)
         timer_label = Text("t (days):", font_size=18)
         hud_bg = RoundedRectangle(corner_radius=0.08, width=2.4, height=0.4).set_fill("#08090a", 0.6).set_stroke(width=0)
@@ -355,11 +276,8 @@ class MasterScene(MovingCameraScene):
         self.play(FadeIn(primary_group), FadeIn(sec_group), run_time=0.9)
         self.add(hud_group)
 
-        # Temporarily suspend critical updaters to avoid deepcopy/pickle issues
-        self._suspend_critical_updaters()
         self.play(self.camera.frame.animate.scale(0.82).move_to(shield_group.get_center() + RIGHT * 1.1),
                   run_time=1.15, rate_func=smooth)
-        self._resume_critical_updaters()
 
         # 1) Pallet release & DTA extension (animated)
         self.play(LaggedStart(*[p.animate.shift(DOWN*0.25 + RIGHT*0.06).set_fill("#3e3e3e") for p in pallets], lag_ratio=0.08),
@@ -399,10 +317,8 @@ class MasterScene(MovingCameraScene):
             self.play(mission_timer.animate.set_value(4.5), run_time=0.5)
 
         # camera pull back to show assembled telescope
-        self._suspend_critical_updaters()
         self.play(self.camera.frame.animate.scale(1.12).move_to(primary_group.get_center()).shift(UP*0.12),
                   run_time=1.0, rate_func=smooth)
-        self._resume_critical_updaters()
 
         self.wait(0.6)
         glint = Circle(radius=0.14, fill_color="#fff6b3", fill_opacity=0.11).move_to(primary_group.get_center() + UP*0.15 + RIGHT*0.18)
@@ -416,7 +332,7 @@ class MasterScene(MovingCameraScene):
     def l2_explainer(self):
         # Clear foreground but preserve background updaters by re-adding them
         self.clear()
-        self.add(self.bg_far, self.nebula, self.galaxy, self.bg_mid, self.bg_near, self._comet_dummy)
+        self.add(*self.background_layers())
         # re-add overlays
         self.add_vignette_and_grade()
 
@@ -461,6 +377,8 @@ class MasterScene(MovingCameraScene):
         sunshield_rect = Rectangle(width=0.34, height=0.06, fill_color="#d2a86f", fill_opacity=0.9, stroke_opacity=0)
         telescope_icon = VGroup(sunshield_rect, telescope_body, telescope_mirror)
         telescope_icon.arrange(RIGHT, buff=0.02)
+        # body + mirror never change shape, so they are drawn from a cached sprite; the sunshield turns on its own
+        telescope_icon = VGroup(sunshield_rect, BakedGroup(telescope_body, telescope_mirror))
         telescope_icon.move_to(start)
         telescope_icon.set_z_index(60)
 
@@ -492,10 +410,8 @@ class MasterScene(MovingCameraScene):
                        sun_ref.get_center()[0] - tel_ref.get_center()[0]) + PI/2
         ))
 
-        # Move along the underlying traj; suspend critical updaters to avoid deepcopy issues
-        self._suspend_critical_updaters()
+        # Move along the underlying traj
         self.play(MoveAlongPath(telescope_icon, traj, run_time=3.0, rate_func=smooth))
-        self._resume_critical_updaters()
 
         # show blocking triangle to demonstrate sunshield orientation
         block_triangle = Polygon(sun.get_right(), telescope_icon.get_left() + UP*0.06, telescope_icon.get_left() + DOWN*0.06)
@@ -597,4 +513,10 @@ class MasterScene(MovingCameraScene):
         self.add(ghosts)
         self.play(LaggedStart(*[FadeOut(g, run_time=0.6) for g in ghosts], lag_ratio=0.03), run_time=0.6)
 
+
+class MasterScenePlate(MasterScene):
+    """MasterScene with the deep background served from the cached looping plate."""
+
+    use_background_plate = True
+
 # End of file
@@ -0,0 +1,194 @@
+# plate_cache.py
+"""
+Looping background plates for the slow deep-space layers.
+
+bg_far, the nebula and the galaxy only drift and twinkle, so instead of
+re-rasterizing them every frame they can be rendered once into a short,
+seamlessly looping frame sequence. The sequence is stored as a single
+``.npy`` file under ``media/plates`` keyed by the layer parameters and seed,
+memory-mapped on load, and shown through one ImageMobject that swaps frames.
+"""
+from manim import *
+from manim import config
+import hashlib
+import json
+import math
+import os
+import numpy as np
+
+from background import SpiralGalaxy, TwinkleStarfield
+
+PLATE_VERSION = 1
+
+
+# --------------------
+# Cache helpers
+# --------------------
+def plate_key(params: dict) -> str:
+    blob = json.dumps(params, sort_keys=True)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def plate_cache_dir() -> str:
+    return os.path.join(config.media_dir, "plates")
+
+
+class _SharedFrames:
+    """Holds the memory-mapped frames; copies of a plate share it instead of duplicating it."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, i):
+        return self.frames[i]
+
+
+# --------------------
+# Loopable layers
+# --------------------
+def _loop_speeds(speeds, loop_duration):
+    # |sin(phase)| repeats every PI, so snap each star to a whole number of repeats per loop
+    cycles = np.maximum(1, np.round(speeds * loop_duration / PI))
+    return cycles * PI / loop_duration
+
+
+def _build_loop_nebula(blobs, rng):
+    """Nebula blobs plus per-blob drift velocities (same distribution as MasterScene.create_nebula)."""
+    neb = VGroup()
+    palette = ["#12203a", "#26304a", "#2b1a3f", "#1e2240", "#2a1630"]
+    velocities = np.zeros((blobs, 3))
+    for i in range(blobs):
+        radius = rng.uniform(2.6, 4.2) - i * 0.2
+        blob = Circle(radius=radius, fill_color=palette[i % len(palette)], fill_opacity=0.025 + i * 0.02, stroke_opacity=0)
+        blob.shift(np.array([rng.uniform(-3.0, 3.0) + i * 0.4, rng.uniform(-0.9, 1.6) - i * 0.25, 0]))
+        velocities[i, 0] = rng.uniform(0.004, 0.014) * (0.6 + i * 0.16)
+        velocities[i, 1] = rng.uniform(-0.004, 0.009) * (0.6 + i * 0.1)
+        neb.add(blob)
+    return neb, velocities
+
+
+def render_plate_frames(path, params):
+    """Render one full loop of the deep layers into ``path`` (a memory-mappable .npy)."""
+    loop = params["loop_duration"]
+    n_frames = max(1, int(round(loop * params["plate_fps"])))
+    ppu = params["pixels_per_unit"]
+    x0, x1, y0, y1 = params["bounds"]
+    width_px = max(1, int(math.ceil((x1 - x0) * ppu)))
+    height_px = max(1, int(math.ceil((y1 - y0) * ppu)))
+
+    rng = np.random.default_rng(params["seed"])
+    stars = params["stars"]
+    far = TwinkleStarfield(n=stars["n"], radius=stars["radius"], speed_range=tuple(stars["speed_range"]),
+                           margin=params["margin"], seed=rng.integers(2**32), pixels_per_unit=ppu)
+    far.clear_updaters()
+    far.twinkle_speed = _loop_speeds(far.twinkle_speed, loop)
+    phase0 = far.phase.copy()
+
+    nebula, velocities = _build_loop_nebula(params["nebula_blobs"], rng)
+    blob_home = [blob.get_center() for blob in nebula]
+
+    gal = params["galaxy"]
+    galaxy = SpiralGalaxy(center=np.array(gal["center"]), arms=gal["arms"], points=gal["points"],
+                          spiral_tightness=gal["spiral_tightness"], spin_rate=gal["spin_rate"],
+                          seed=rng.integers(2**32), pixels_per_unit=ppu)
+    galaxy.clear_updaters()
+
+    camera = Camera(pixel_width=width_px, pixel_height=height_px,
+                    frame_width=width_px / ppu, frame_height=height_px / ppu,
+                    frame_center=np.array([x0 + width_px / ppu / 2, y0 + height_px / ppu / 2, 0]),
+                    background_opacity=0)
+
+    tmp_path = f"{path[:-4]}.{os.getpid()}.tmp.npy"
+    frames = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.uint8, shape=(n_frames, height_px, width_px, 4))
+    for k in range(n_frames):
+        t = k / params["plate_fps"]
+        # drift and spin become periodic with the same peak speed as the live layers
+        wave = math.sin(TAU * t / loop)
+        for blob, home, v in zip(nebula, blob_home, velocities):
+            blob.move_to(home + v * loop / TAU * wave)
+        galaxy.set_angle(galaxy.spin_rate * loop / TAU * wave)
+        far.phase = phase0 + far.twinkle_speed * t
+        far.twinkle(0)
+
+        camera.reset()
+        camera.capture_mobjects([nebula, galaxy, far])
+        # cairo leaves premultiplied colour over a transparent background; store straight alpha
+        rgba = camera.pixel_array.astype(np.float32)
+        alpha = rgba[..., 3:4]
+        rgba[..., :3] = np.where(alpha > 0, rgba[..., :3] * 255.0 / np.maximum(alpha, 1.0), 0.0)
+        frames[k] = np.clip(rgba, 0, 255).astype(np.uint8)
+    frames.flush()
+    del frames
+    os.replace(tmp_path, path)
+
+
+# --------------------
+# Plate mobject
+# --------------------
+class BackgroundPlate(ImageMobject):
+    """Shows a cached looping frame sequence; one image blit per frame."""
+
+    crop_to_view = True
+
+    def __init__(self, frames, plate_fps, bounds, **kwargs):
+        super().__init__(np.array(frames[0]), **kwargs)
+        x0, x1, y0, y1 = bounds
+        height_px, width_px = frames[0].shape[:2]
+        ppu = width_px / (x1 - x0)
+        self.stretch_to_fit_width(width_px / ppu)
+        self.stretch_to_fit_height(height_px / ppu)
+        self.move_to(np.array([x0 + width_px / ppu / 2, y0 + height_px / ppu / 2, 0]))
+        self.frames = _SharedFrames(frames)
+        self.plate_fps = plate_fps
+        self.time = 0.0
+        self._frame_index = 0
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def advance(self, dt):
+        return self.set_time(self.time + dt)
+
+    def set_time(self, t):
+        self.time = t
+        index = int(t * self.plate_fps) % len(self.frames)
+        if index != self._frame_index:
+            self.pixel_array = np.asarray(self.frames[index])
+            self._frame_index = index
+        return self
+
+
+def load_background_plate(stars=None, nebula_blobs=5, galaxy=None, seed=0, loop_duration=12.0,
+                          plate_fps=10, resolution_scale=0.5, margin=1.0):
+    """
+    Return a BackgroundPlate for the given deep layers, rendering it on a cache miss.
+
+    ``resolution_scale`` is relative to the output resolution; the deep layers
+    are soft and distant, so half resolution is usually indistinguishable.
+    """
+    stars = stars or dict(n=140, radius=0.012, speed_range=(0.2, 0.6))
+    galaxy = galaxy or dict(center=(-3.0, 1.2, 0.0), arms=2, points=220, spiral_tightness=0.25, spin_rate=0.0006)
+    half_w = config.frame_width / 2 + margin
+    half_h = config.frame_height / 2 + margin
+    params = dict(
+        version=PLATE_VERSION,
+        stars=dict(stars, speed_range=list(stars["speed_range"])),
+        nebula_blobs=nebula_blobs,
+        galaxy=dict(galaxy, center=list(galaxy["center"])),
+        seed=seed,
+        loop_duration=loop_duration,
+        plate_fps=plate_fps,
+        margin=margin,
+        pixels_per_unit=config.pixel_height / config.frame_height * resolution_scale,
+        bounds=[-half_w, half_w, -half_h, half_h],
+    )
+    os.makedirs(plate_cache_dir(), exist_ok=True)
+    path = os.path.join(plate_cache_dir(), f"plate_{plate_key(params)}.npy")
+    if not os.path.exists(path):
+        render_plate_frames(path, params)
+    frames = np.load(path, mmap_mode="r")
+    return BackgroundPlate(frames, plate_fps, params["bounds"])
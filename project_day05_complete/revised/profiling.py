@@ -0,0 +1,165 @@
+# profiling.py
+"""
+Opt-in per-updater cost profiler.
+
+Mix ``UpdaterProfilingMixin`` into a scene and set ``UPDATER_PROFILE`` to
+turn it on:
+
+    UPDATER_PROFILE=1 manim -ql main.py MasterScene              # ranked table
+    UPDATER_PROFILE=updaters.json manim -ql main.py MasterScene  # table + JSON
+
+Before every update pass, each updater attached to the scene or to a mobject
+on screen is swapped for a timing wrapper. The wrapper keeps the original's
+signature (so manim still sees ``dt``) and compares equal to it (so
+``remove_updater`` keeps working). Timings are grouped per updater and per
+manim section; the report ranks them by cumulative time.
+"""
+from manim import *
+import json
+import os
+import time
+import numpy as np
+
+
+def updater_label(func):
+    """Readable, stable name for an updater: qualified name plus file:line."""
+    code = getattr(func, "__code__", None)
+    name = getattr(func, "__qualname__", None) or type(func).__name__
+    if code is None:
+        return name
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class UpdaterProfiler:
+    """Collects per-call durations keyed by (section, updater label)."""
+
+    def __init__(self):
+        self.section = "autocreated"
+        self.samples = {}
+
+    def record(self, label, seconds):
+        self.samples.setdefault((self.section, label), []).append(seconds)
+
+    def _rows(self, key_of):
+        grouped = {}
+        for (section, label), values in self.samples.items():
+            grouped.setdefault(key_of(section, label), []).extend(values)
+        rows = []
+        for key, values in grouped.items():
+            arr = np.asarray(values)
+            rows.append(dict(key=key, calls=int(arr.size), total_ms=float(arr.sum() * 1e3),
+                             mean_ms=float(arr.mean() * 1e3), p95_ms=float(np.percentile(arr, 95) * 1e3)))
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+    def summary(self):
+        by_updater = self._rows(lambda section, label: label)
+        by_section = self._rows(lambda section, label: (section, label))
+        for row in by_updater:
+            row["updater"] = row.pop("key")
+        for row in by_section:
+            row["section"], row["updater"] = row.pop("key")
+        return dict(by_updater=by_updater, by_section=by_section)
+
+    def format_table(self, limit=25):
+        summary = self.summary()
+        lines = [f"{'updater':<60} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9}"]
+        for row in summary["by_updater"][:limit]:
+            lines.append(f"{row['updater'][:60]:<60} {row['calls']:>7} {row['total_ms']:>10.1f} "
+                         f"{row['mean_ms']:>9.3f} {row['p95_ms']:>9.3f}")
+        lines.append("")
+        lines.append(f"{'section':<22} {'updater':<48} {'total ms':>10} {'p95 ms':>9}")
+        for row in summary["by_section"][:limit]:
+            lines.append(f"{row['section'][:22]:<22} {row['updater'][:48]:<48} "
+                         f"{row['total_ms']:>10.1f} {row['p95_ms']:>9.3f}")
+        return "\n".join(lines)
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.summary(), fh, indent=2)
+        return path
+
+
+class TimedUpdater:
+    """Wraps an updater, timing each call; equal to (and hashed like) the wrapped function."""
+
+    def __init__(self, func, profiler):
+        self.__wrapped__ = func  # inspect.signature follows this, so "dt" detection still works
+        self.profiler = profiler
+        self.label = updater_label(func)
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.__wrapped__(*args, **kwargs)
+        finally:
+            self.profiler.record(self.label, time.perf_counter() - start)
+
+    def __eq__(self, other):
+        if isinstance(other, TimedUpdater):
+            other = other.__wrapped__
+        return self.__wrapped__ == other
+
+    def __hash__(self):
+        return hash(self.__wrapped__)
+
+    def __deepcopy__(self, memo):
+        # copies of a mobject keep reporting into the same profiler
+        return self
+
+
+def unwrap_updater(func):
+    return func.__wrapped__ if isinstance(func, TimedUpdater) else func
+
+
+class UpdaterProfilingMixin:
+    """
+    Scene mixin; put it before the Scene base class.
+
+    ``profile_updaters`` overrides the ``UPDATER_PROFILE`` environment variable:
+    falsy disables profiling, a path ending in ``.json`` also writes the summary
+    there, anything else prints the table only.
+    """
+
+    profile_updaters = None
+
+    def setup(self):
+        super().setup()
+        target = self.profile_updaters or os.environ.get("UPDATER_PROFILE")
+        self.updater_profile_target = target if target and target != "0" else None
+        self.updater_profiler = UpdaterProfiler() if self.updater_profile_target else None
+
+    def _instrument(self, updaters):
+        for i, func in enumerate(updaters):
+            if not isinstance(func, TimedUpdater):
+                updaters[i] = TimedUpdater(func, self.updater_profiler)
+
+    def update_mobjects(self, dt):
+        if self.updater_profiler is not None:
+            for mob in self.get_mobject_family_members():
+                if mob.updaters:
+                    self._instrument(mob.updaters)
+        super().update_mobjects(dt)
+
+    def update_self(self, dt):
+        if self.updater_profiler is not None:
+            self._instrument(self.updaters)
+        super().update_self(dt)
+
+    def remove_updater(self, func):
+        # Scene.remove_updater compares by identity, which a wrapper would defeat
+        self.updaters = [f for f in self.updaters if unwrap_updater(f) is not unwrap_updater(func)]
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        if self.updater_profiler is not None:
+            self.updater_profiler.section = name
+        super().next_section(name, *args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.updater_profiler is None:
+            return
+        print(self.updater_profiler.format_table())
+        if str(self.updater_profile_target).endswith(".json"):
+            path = self.updater_profiler.write_json(self.updater_profile_target)
+            print(f"updater profile written to {path}")
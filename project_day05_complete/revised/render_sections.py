@@ -0,0 +1,97 @@
+# render_sections.py
+"""
+Render MasterScene's sections in parallel and join them into MasterScene.mp4.
+
+Every section is rendered by its own worker process (one core each), so
+at most ``len(MasterScene.SECTIONS)`` (four) processes run, whatever ``-j``
+asks for. The worker runs the whole scene, but sections other than its own
+are skipped: their logic runs and no frames are written. The section videos are then
+joined with ffmpeg's concat demuxer using stream copy, so nothing is
+re-encoded.
+
+Run this from the `revised` folder:
+
+    python render_sections.py -q h
+
+``-t draft|preview|final`` picks the detail tier (see quality.py); by default
+it follows the quality flag.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+QUALITIES = {"l": "low_quality", "m": "medium_quality", "h": "high_quality", "p": "production_quality", "k": "fourk_quality"}
+
+
+def render_section(job):
+    """Worker: render one section of MasterScene and return its movie path."""
+    index, name, quality = job
+    os.chdir(HERE)
+    sys.path.insert(0, HERE)
+    from manim import tempconfig
+    import main
+
+    section_id = f"{index:02d}_{name}"
+    options = {
+        "quality": quality,
+        "input_file": os.path.join(HERE, "main.py"),
+        "output_file": f"MasterScene_{section_id}",
+        # separate partial-movie folder per worker so cache cleanup cannot race
+        "partial_movie_dir": "{media_dir}/videos/{module_name}/{quality}/partial_movie_files/MasterScene_" + section_id,
+        "write_to_movie": True,
+        "preview": False,
+    }
+    with tempconfig(options):
+        scene = main.MasterScene()
+        scene.render_sections = {name}  # this instance only; the class keeps rendering everything
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_lossless(paths, output_path):
+    """Join same-codec movies without re-encoding (ffmpeg concat demuxer, stream copy)."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to join the section movies")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in paths:
+            listing.write(f"file '{os.path.abspath(path)}'\n")
+    try:
+        subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing.name, "-c", "copy", output_path], check=True)
+    finally:
+        os.remove(listing.name)
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render MasterScene sections in parallel.")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-t", "--tier", choices=("draft", "preview", "final"), default=None,
+                        help="detail tier; defaults to the one matching the quality")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(),
+                        help="worker processes; capped at the number of sections (4)")
+    parser.add_argument("-o", "--output", default=None, help="defaults to MasterScene.mp4 next to the section movies")
+    args = parser.parse_args(argv)
+    if args.tier:
+        os.environ["RENDER_TIER"] = args.tier  # inherited by the workers
+
+    sys.path.insert(0, HERE)
+    from main import MasterScene
+
+    jobs = [(i, name, QUALITIES[args.quality]) for i, name in enumerate(MasterScene.SECTIONS)]
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(jobs)))) as pool:
+        movies = list(pool.map(render_section, jobs))
+
+    output = args.output or os.path.join(os.path.dirname(movies[0]), "MasterScene.mp4")
+    concat_lossless(movies, output)
+    print(f"MasterScene written to {output}")
+
+
+if __name__ == "__main__":
+    main()
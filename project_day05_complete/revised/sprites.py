@@ -0,0 +1,189 @@
+# sprites.py
+"""
+Bake rigid vector groups into cached raster sprites.
+
+A ``BakedGroup`` behaves like a VGroup in the scene (move, rotate, scale and
+animate it as usual) but the camera draws it from a cached RGBA texture.
+Each capture fits a similarity transform (uniform scale, rotation,
+translation) from the points at bake time to the current points, and draws
+the texture with that transform. The group is re-baked when:
+
+* its shape changes in a way that is not a similarity transform,
+* its colours change other than a uniform opacity change (fades just
+  scale the sprite's alpha), or
+* its on-screen size leaves the texture's resolution bucket (quarter octaves).
+
+Textures are cached in ``_SPRITE_CACHE`` by geometry hash, style and resolution
+bucket, so identical groups (e.g. copies of a station) share one bake.
+``SpriteCameraMixin`` goes in front of the Camera class.
+"""
+from manim import *
+import hashlib
+import math
+import numpy as np
+
+_SPRITE_CACHE = {}
+_SPRITE_CACHE_SIZE = 64
+
+
+def _style_arrays(mobjects):
+    """(rgb, opacity) of every fill/stroke colour stop, plus stroke widths, in family order."""
+    rgbas, widths = [], []
+    for mob in mobjects:
+        for rgba in (mob.get_fill_rgbas(), mob.get_stroke_rgbas(), mob.get_stroke_rgbas(background=True)):
+            rgbas.append(np.asarray(rgba, dtype=float).reshape(-1, 4))
+        widths.append([mob.get_stroke_width(), mob.get_stroke_width(background=True)])
+    rgbas = np.concatenate(rgbas) if rgbas else np.zeros((0, 4))
+    return rgbas[:, :3], rgbas[:, 3], np.asarray(widths, dtype=float)
+
+
+def _similarity(rest, current):
+    """Least-squares s, R, t with current ~ s * rest @ R.T + t, and the rms residual."""
+    c0, c1 = rest.mean(axis=0), current.mean(axis=0)
+    x, y = rest - c0, current - c1
+    var = (x ** 2).sum()
+    if var < 1e-12:
+        return 1.0, np.eye(2), c1 - c0, 0.0
+    u, sig, vt = np.linalg.svd(y.T @ x)
+    d = np.sign(np.linalg.det(u @ vt)) or 1.0
+    rot = u @ np.diag([1.0, d]) @ vt
+    scale = (sig * np.array([1.0, d])).sum() / var
+    residual = np.sqrt(((y - scale * x @ rot.T) ** 2).sum(axis=1).mean())
+    if d < 0:
+        residual = np.inf  # mirrored: not something a sprite can show
+    return scale, rot, c1 - scale * c0 @ rot.T, residual
+
+
+def bake_to_rgba(mobject, pixels_per_unit, pad=0.05):
+    """Render ``mobject`` offscreen; returns (straight-alpha RGBA, (xmin, xmax, ymin, ymax))."""
+    pts = mobject.get_all_points()
+    x0, x1 = pts[:, 0].min() - pad, pts[:, 0].max() + pad
+    y0, y1 = pts[:, 1].min() - pad, pts[:, 1].max() + pad
+    width_px = max(1, min(4096, int(math.ceil((x1 - x0) * pixels_per_unit))))
+    height_px = max(1, min(4096, int(math.ceil((y1 - y0) * pixels_per_unit))))
+    camera = Camera(pixel_width=width_px, pixel_height=height_px, frame_width=x1 - x0, frame_height=y1 - y0,
+                    frame_center=np.array([(x0 + x1) / 2, (y0 + y1) / 2, 0]), background_opacity=0)
+    camera.capture_mobjects([mobject])
+    # cairo leaves premultiplied colour over a transparent background; ImageMobject wants straight alpha
+    rgba = camera.pixel_array.astype(np.float32)
+    alpha = rgba[..., 3:4]
+    rgba[..., :3] = np.where(alpha > 0, rgba[..., :3] * 255.0 / np.maximum(alpha, 1.0), 0.0)
+    return np.clip(rgba, 0, 255).astype(np.uint8), (x0, x1, y0, y1)
+
+
+class BakedGroup(VGroup):
+    """VGroup the camera draws as a transformed, cached sprite; see the module docstring."""
+
+    def __init__(self, *vmobjects, residual_tolerance=1e-3, **kwargs):
+        super().__init__(*vmobjects, **kwargs)
+        self.residual_tolerance = residual_tolerance
+        self._bake = None
+
+    def _rest_points(self):
+        return np.concatenate([m.points[:, :2] for m in self.family_members_with_points()])
+
+    def _geometry_key(self, points, rgb, opacity, widths, bucket):
+        digest = hashlib.sha1()
+        for arr in (points - points.mean(axis=0), rgb, opacity, widths):
+            digest.update(np.round(arr, 5).tobytes())
+        digest.update(str(bucket).encode())
+        return digest.hexdigest()
+
+    def _rebake(self, points, style, camera_ppu):
+        rgb, opacity, widths = style
+        # bake at full strength; the current overall opacity is applied as sprite alpha
+        peak = opacity.max()
+        bucket = math.ceil(math.log2(max(camera_ppu, 1e-6)) * 4) / 4
+        key = self._geometry_key(points, rgb, opacity / peak, widths, bucket)
+        if key not in _SPRITE_CACHE:
+            if len(_SPRITE_CACHE) >= _SPRITE_CACHE_SIZE:
+                _SPRITE_CACHE.pop(next(iter(_SPRITE_CACHE)))
+            source = self
+            if peak < 1.0:
+                source = self.copy()
+                for mob in source.family_members_with_points():
+                    for rgbas in (mob.fill_rgbas, mob.stroke_rgbas, mob.background_stroke_rgbas):
+                        rgbas[:, 3] = np.clip(rgbas[:, 3] / peak, 0.0, 1.0)
+            _SPRITE_CACHE[key] = bake_to_rgba(source, 2 ** bucket)
+        pixels, bounds = _SPRITE_CACHE[key]
+        self._bake = dict(key=key, points=points, rgb=rgb, opacity=opacity / peak, widths=widths,
+                          bucket=bucket, pixels=pixels, bounds=bounds)
+        return self._bake
+
+    def sprite_for(self, camera_ppu):
+        """ImageMobject showing this group as the camera would draw it right now; None if invisible."""
+        members = self.family_members_with_points()
+        if not members:
+            return None
+        points = self._rest_points()
+        rgb, opacity, widths = _style_arrays(members)
+        if opacity.max() <= 1e-6:
+            return None
+        bake = self._bake
+        stale = (bake is None or len(points) != len(bake["points"]) or len(rgb) != len(bake["rgb"])
+                 or not np.allclose(rgb, bake["rgb"]) or not np.allclose(widths, bake["widths"]))
+        if not stale:
+            scale, rot, shift, residual = _similarity(bake["points"], points)
+            size = np.ptp(points, axis=0).max() or 1.0
+            visible = bake["opacity"] > 1e-6
+            ratios = opacity[visible] / bake["opacity"][visible]
+            alpha = float(ratios.mean())
+            bucket = math.ceil(math.log2(max(camera_ppu * scale, 1e-6)) * 4) / 4
+            stale = (residual > self.residual_tolerance * size or np.ptp(ratios) > 1e-3
+                     or not np.allclose(opacity[~visible], 0) or bucket != bake["bucket"])
+        if stale:
+            bake = self._rebake(points, (rgb, opacity, widths), camera_ppu)
+            scale, rot, shift, alpha = 1.0, np.eye(2), np.zeros(2), float(opacity.max())
+
+        sprite = getattr(self, "_sprite", None)
+        if sprite is None or sprite.baked_key != bake["key"] or sprite.baked_alpha != alpha:
+            pixels = bake["pixels"]
+            if alpha < 1.0:
+                pixels = pixels.copy()
+                pixels[..., 3] = (pixels[..., 3] * alpha).astype(np.uint8)
+            sprite = ImageMobject(pixels)
+            sprite.baked_key, sprite.baked_alpha = bake["key"], alpha
+            self._sprite = sprite
+        x0, x1, y0, y1 = bake["bounds"]
+        corners = np.array([[x0, y1], [x1, y1], [x0, y0], [x1, y0]])  # UL, UR, DL, DR
+        placed = scale * corners @ rot.T + shift
+        sprite.points = np.column_stack([placed, np.zeros(4)])
+        sprite.z_index = max(m.z_index for m in self.get_family())
+        return sprite
+
+    def __deepcopy__(self, memo):
+        # copies share the (read-only) bake and build their own sprite on first capture
+        bake, sprite = self._bake, getattr(self, "_sprite", None)
+        self._bake, self._sprite = None, None
+        try:
+            result = super().__deepcopy__(memo)
+        finally:
+            self._bake, self._sprite = bake, sprite
+        result._bake = bake
+        return result
+
+
+class SpriteCameraMixin:
+    """Camera mixin: draws every BakedGroup in the captured families from its sprite."""
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        groups = [m for m in extract_mobject_family_members(mobjects, only_those_with_points=False)
+                  if isinstance(m, BakedGroup)]
+        if not groups:
+            return super().capture_mobjects(mobjects, **kwargs)
+        frame = getattr(self, "frame", None)
+        frame_width = frame.width if frame is not None else self.frame_width
+        ppu = self.pixel_width / frame_width
+        swapped = []
+        for group in groups:
+            if any(group is owner or group in owner.get_family() for owner, _ in swapped):
+                continue  # nested inside a group that is already drawn as a sprite
+            swapped.append((group, group.submobjects))
+        try:
+            for group, _ in swapped:
+                sprite = group.sprite_for(ppu)
+                group.submobjects = [sprite] if sprite is not None else []
+            super().capture_mobjects(mobjects, **kwargs)
+        finally:
+            for group, submobjects in swapped:
+                group.submobjects = submobjects